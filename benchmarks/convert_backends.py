@@ -0,0 +1,101 @@
+# Time of the Convert_* json and yaml functions on each backend, orjson and libyaml against the
+# stdlib json module and pure Python PyYAML. The parse cache is disabled so every call parses.
+# Needs the collection importable as ansible_collections.aybarsm.utils, for example from a
+# checkout at <path>/ansible_collections/aybarsm/utils:
+#   python benchmarks/convert_backends.py [--items 500] [--number 3]
+import argparse, json, pathlib, random, sys, timeit
+
+_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if _ROOT.parent.name == 'aybarsm' and _ROOT.parents[1].name == 'ansible_collections':
+    sys.path.insert(0, str(_ROOT.parents[2]))
+
+from ansible_collections.aybarsm.utils.plugins.module_utils.support.definitions import (
+    CONF,
+)
+from ansible_collections.aybarsm.utils.plugins.module_utils.support.convert import (
+    Convert_as_backends, Convert_from_json, Convert_from_yaml, Convert_to_yaml,
+)
+
+BACKENDS = {
+    'native': {'json': 'orjson', 'yaml': 'libyaml'},
+    'pure python': {'json': 'json', 'yaml': 'python'},
+}
+
+def resources(count: int, rnd: random.Random) -> list:
+    # Shaped like a pvesh /cluster/resources listing
+    return [{
+        'id': f'qemu/{100 + idx}',
+        'type': rnd.choice(['qemu', 'lxc', 'storage', 'node']),
+        'node': f'pve{idx % 8}',
+        'status': rnd.choice(['running', 'stopped']),
+        'name': f'vm-{idx:04d}.example.internal',
+        'maxcpu': rnd.choice([1, 2, 4, 8]),
+        'cpu': round(rnd.random(), 6),
+        'maxmem': rnd.choice([2, 4, 8, 16]) * 1024 ** 3,
+        'mem': rnd.randint(10 ** 8, 10 ** 10),
+        'uptime': rnd.randint(0, 10 ** 7),
+        'tags': 'prod;web',
+        'netin': rnd.randint(0, 10 ** 12),
+        'hastate': None,
+    } for idx in range(count)]
+
+def schema(depth: int, rnd: random.Random) -> dict:
+    if depth > 3:
+        return {'type': rnd.choice(['string', 'integer', 'boolean']), 'description': 'Field description text. ' * rnd.randint(1, 3)}
+
+    return {'type': 'object', 'required': ['id', 'name'], 'properties': {f'p{num}': schema(depth + 1, rnd) for num in range(rnd.randint(2, 5))}}
+
+def spec(count: int, rnd: random.Random) -> dict:
+    # Shaped like a swagger document of a REST API
+    parameters = [{'name': name, 'in': 'path', 'required': True, 'type': 'string'} for name in ('server_id', 'zone_id')]
+    return {
+        'swagger': '2.0',
+        'info': {'title': 'Example API', 'version': '1.0.0'},
+        'paths': {f'/servers/{{server_id}}/zones/{{zone_id}}/res{idx}': {method: {
+            'operationId': f'op{idx}{method}',
+            'parameters': parameters,
+            'responses': {'200': {'description': 'OK', 'schema': schema(1, rnd)}, '404': {'description': 'Not found'}},
+        } for method in ('get', 'put', 'delete')} for idx in range(count // 50)},
+        'definitions': {f'Def{idx}': schema(0, rnd) for idx in range(count // 100)},
+    }
+
+def measure(callback, number: int) -> float:
+    return min(timeit.repeat(callback, number=number, repeat=3)) / number * 1000
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--items', type=int, default=500)
+    parser.add_argument('--number', type=int, default=3)
+    args = parser.parse_args()
+
+    rnd = random.Random(11)
+    payloads = {'resources': resources(args.items, rnd), 'spec': spec(args.items, rnd)}
+    documents = {name: (json.dumps(payload), Convert_to_yaml(payload)) for name, payload in payloads.items()}
+    CONF['convert']['parse']['cache']['size'] = 0
+    timings = {}
+
+    for backend, names in BACKENDS.items():
+        CONF['convert']['backends'].update(names)
+        try:
+            print(f'{backend}: {Convert_as_backends()}')
+        except RuntimeError as e:
+            print(f'{backend}: skipped, {e}')
+            continue
+
+        for name, (source_json, source_yaml) in documents.items():
+            if Convert_from_json(source_json) != payloads[name] or Convert_from_yaml(source_yaml) != payloads[name]:
+                raise RuntimeError(f'Backend [{backend}] changed the parsed {name} payload')
+
+            timings[(backend, name)] = (
+                measure(lambda: Convert_from_json(source_json), args.number * 10),
+                measure(lambda: Convert_from_yaml(source_yaml), args.number),
+                measure(lambda: Convert_to_yaml(payloads[name]), args.number),
+            )
+
+    print(f'\n{"payload":<16} {"backend":<12} {"json load":>12} {"yaml load":>12} {"yaml dump":>12}')
+    for (backend, name), (json_load, yaml_load, yaml_dump) in sorted(timings.items(), key=lambda item: item[0][1]):
+        label = f'{name} {len(documents[name][1]) // 1024}K'
+        print(f'{label:<16} {backend:<12} {json_load:9.2f} ms {yaml_load:9.2f} ms {yaml_dump:9.2f} ms')
+
+if __name__ == '__main__':
+    main()
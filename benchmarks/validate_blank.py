@@ -0,0 +1,61 @@
+# Time of Validate_is_blank type dispatch against the isinstance chain it replaced, which is kept
+# as _blank_uncached for proxies. Needs the collection importable as ansible_collections.aybarsm.utils,
+# for example from a checkout at <path>/ansible_collections/aybarsm/utils:
+#   python benchmarks/validate_blank.py [--number 200000]
+import argparse, collections, pathlib, sys, timeit, types
+
+_ROOT = pathlib.Path(__file__).resolve().parents[1]
+if _ROOT.parent.name == 'aybarsm' and _ROOT.parents[1].name == 'ansible_collections':
+    sys.path.insert(0, str(_ROOT.parents[2]))
+
+from ansible_collections.aybarsm.utils.plugins.module_utils.support.validate import (
+    Validate_is_blank, _blank_uncached,
+)
+
+class Text(str):
+    pass
+
+VALUES = {
+    'None': None,
+    'str': 'web01',
+    'str blank': '   ',
+    'str subclass': Text('web01'),
+    'int': 8080,
+    'float': 2.5,
+    'bool': True,
+    'bytes': b'web01',
+    'list': [1, 2, 3],
+    'list empty': [],
+    'tuple': (1, 2),
+    'dict': {'a': 1},
+    'dict empty': {},
+    'OrderedDict': collections.OrderedDict(a=1),
+    'mappingproxy': types.MappingProxyType({'a': 1}),
+    'set': {1, 2},
+}
+
+def measure(callback, values: list, number: int) -> float:
+    duration = min(timeit.repeat(lambda: [callback(value) for value in values], number=number, repeat=5))
+    return duration / (number * len(values)) * 10 ** 9
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--number', type=int, default=100000)
+    args = parser.parse_args()
+
+    cases = {label: [value] for label, value in VALUES.items()}
+    cases['mixed'] = list(VALUES.values())
+
+    print(f'{"value":<16} {"dispatch":>12} {"isinstance":>12} {"speedup":>8}')
+    for label, values in cases.items():
+        for value in values:
+            if Validate_is_blank(value) != _blank_uncached(value):
+                raise RuntimeError(f'Dispatch and isinstance chain disagree on {label}')
+
+        number = max(1, args.number // len(values))
+        dispatch = measure(Validate_is_blank, values, number)
+        chain = measure(_blank_uncached, values, number)
+        print(f'{label:<16} {dispatch:9.1f} ns {chain:9.1f} ns {chain / dispatch:7.1f}x')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+### BEGIN: Imports
+import collections
+from ansible_collections.aybarsm.utils.plugins.module_utils.support.definitions import (
+    t,
+    CONF,
+)
+### END: Imports
+### BEGIN: ImportManager
+### END: ImportManager
+
+class DataQueryCache:
+    def __init__(self, size: int = 256):
+        self.size: int = int(size)
+        self.items: collections.OrderedDict[t.Hashable, t.Any] = collections.OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def get(self, key: t.Hashable, default: t.Any = None) -> t.Any:
+        if key not in self.items:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        self.items.move_to_end(key)
+        return self.items[key]
+
+    def set(self, key: t.Hashable, value: t.Any) -> None:
+        if self.size <= 0:
+            return
+
+        self.items[key] = value
+        self.items.move_to_end(key)
+
+        while len(self.items) > self.size:
+            self.items.popitem(last=False)
+
+    def has(self, key: t.Hashable) -> bool:
+        return key in self.items
+
+    def forget(self, key: t.Hashable) -> None:
+        self.items.pop(key, None)
+
+    def clear(self) -> None:
+        self.items.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self) -> dict[str, int]:
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': self.size,
+            'count': len(self.items),
+        }
+
+DataQueryPlanCache = DataQueryCache(CONF['data_query']['cache']['plans']['size'])
@@ -1,19 +1,28 @@
 ### BEGIN: Imports
-import time
+import time, itertools, contextvars
+import concurrent.futures
 from ansible_collections.aybarsm.utils.plugins.module_utils.support.definitions import (
     t, 
 )
 from ansible_collections.aybarsm.utils.plugins.module_utils.support.data_query import DataQuery
+from ansible_collections.aybarsm.utils.plugins.module_utils.support._data_query.predicate import DataQueryPredicate_resolve
+from ansible_collections.aybarsm.utils.plugins.module_utils.support._data_query.index import DataQueryIndex, DataQueryIndexes
+from ansible_collections.aybarsm.utils.plugins.module_utils.support._data_query.optimiser import (
+    DataQueryOptimiser, DataQueryOptimiserRuntimeStats, 
+)
 ### END: Imports
 ### BEGIN: ImportManager
 from ansible_collections.aybarsm.utils.plugins.module_utils.support.ansible import (
 	Ansible_filter_rejectattr, Ansible_filter_selectattr,
 )
 from ansible_collections.aybarsm.utils.plugins.module_utils.support.convert import (
-	Convert_as_copied, Convert_to_items,
+	Convert_to_iterable,
 )
 from ansible_collections.aybarsm.utils.plugins.module_utils.support.data import (
-	Data_append, Data_has, Data_pluck,
+	Data_accessor,
+)
+from ansible_collections.aybarsm.utils.plugins.module_utils.support.str import (
+	Str_chop_start,
 )
 from ansible_collections.aybarsm.utils.plugins.module_utils.support.validate import (
 	Validate_blank, Validate_filled,
@@ -22,127 +31,305 @@ from ansible_collections.aybarsm.utils.plugins.module_utils.support.validate imp
 
 class DataQueryExecutor(DataQuery):
     def execute(self) -> t.Any:
-        if self.is_mode_debug():
+        if self.is_mode_debug() or self.is_mode_explain():
             start = time.perf_counter()
+            self.profile = {'groups': {}, 'tests': {}}
 
         ret_default = self.get_default_return()
-        if Validate_blank(self.data):
+        if not self.has_data():
             return ret_default
 
-        if not self.context:
-            raise RuntimeError('Context is not set to execute tests')
+        if self.is_mode_stream():
+            ret = list(self.iterate())
+        else:
+            ret = self._execute_batch()
         
-        token_group = self.get_executor_initial_token_group()
-        ret = []
-        for item in self.get_executor_data():
-            res = self._execute_token_group([item], token_group)
-            if Validate_filled(res):
-                ret.append(res[0])
-            
-            if self.is_first_result() and Validate_filled(ret):
-                break
-
         if Validate_filled(ret):
-            ret = [item for idx, item in enumerate(self.data) if idx in set(Data_pluck(ret, 'key'))]
-
             if self.is_first_result():
                 ret = ret[0]
         else:
             ret = ret_default
         
-        if self.is_mode_debug():
+        if self.is_mode_debug() or self.is_mode_explain():
             end = time.perf_counter()
-            ret = {'data': ret, '_meta': {'duration': f'{end - start:.6f} seconds'}}
+            ret = {'data': ret, '_meta': {'duration': f'{end - start:.6f} seconds', 'cache': self.get_plan_cache_info()}}
+            
+            if self.is_mode_explain():
+                ret['_meta']['explain'] = self.get_explain()
 
         return ret
 
-    def _execute_token_group(self, data: list[dict[str, t.Any]], token_group: dict[str, t.Any]) -> list[dict[str, t.Any]]:
-        if Validate_blank(data):
-            return []
+    def iterate(self) -> t.Iterator[t.Any]:
+        if not self.has_data():
+            return
+        
+        if not self.context:
+            raise RuntimeError('Context is not set to execute tests')
+        
+        token_group = self.get_executor_initial_token_group()
+        limit = self.get_result_limit()
+        chunk_size = self.get_stream_chunk_size()
+        source = self.stream if self.is_streamed() else iter(self.data)
+        count = 0
+
+        # Items are pulled in chunks so the batch evaluation still applies, matches are yielded in source order
+        while True:
+            chunk = list(itertools.islice(source, chunk_size))
+            if not chunk:
+                break
+
+            for idx in sorted(self._execute_token_group(chunk, set(range(len(chunk))), token_group)):
+                yield chunk[idx]
+                count += 1
+                
+                if limit is not None and count >= limit:
+                    return
+
+    def _execute_batch(self) -> list[t.Any]:
+        if not self.context:
+            raise RuntimeError('Context is not set to execute tests')
+        
+        token_group = self.get_executor_initial_token_group()
+        items = self.get_executor_data()
+        
+        if self.is_mode_parallel():
+            matches = self._execute_parallel(items, token_group)
+        else:
+            matches = sorted(self._execute_token_group(items, set(range(len(items))), token_group))
+        
+        limit = self.get_result_limit()
+        
+        return [self.data[idx] for idx in (matches if limit is None else matches[:limit])]
+
+    def _execute_parallel(self, items: list[t.Any], token_group: dict[str, t.Any]) -> list[int]:
+        workers = self.get_parallel_workers()
+        size = -(-len(items) // workers)
+        chunks = [(start, items[start:start + size]) for start in range(0, len(items), size)]
+        
+        # Threads do not inherit context variables, the Jinja fallback needs the active template context
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(contextvars.copy_context().run, _execute_parallel_chunk, self, token_group, chunk) for chunk in chunks]
+            return list(itertools.chain.from_iterable(future.result() for future in futures))
+
+    def _execute_token_group(self, items: list[t.Any], candidates: set[int], token_group: dict[str, t.Any]) -> set[int]:
+        if Validate_blank(candidates):
+            return set()
 
         queue = self._resolve_token_group_execution_queue(token_group)
         
-        if token_group['cond'] == 'all':
-            return self._execute_condition_all(data, queue)
-        elif token_group['cond'] == 'any':
-            return self._execute_condition_any(data, queue)
+        if token_group.get('cond') == 'all' and self.is_mode_optimise():
+            queue = self.get_optimiser().optimise(queue)
+        
+        if self.is_mode_explain():
+            self._profile_token_group(token_group, queue)
+        
+        if token_group.get('cond') == 'all':
+            return self._execute_condition_all(items, candidates, queue)
+        elif token_group.get('cond') == 'any':
+            return self._execute_condition_any(items, candidates, queue)
         
-        return data
+        return set(candidates)
 
-    def _execute_condition_all(self, data: list[dict[str, t.Any]], queue: list[dict[str, t.Any]]) -> list[dict[str, t.Any]]:
-        current_data = data
+    def _execute_queue_item(self, items: list[t.Any], candidates: set[int], item: dict[str, t.Any]) -> set[int]:
+        if item['type'] == 'test':
+            return self._execute_test(items, candidates, item['payload'])
+        elif item['type'] == 'sub':
+            return self._execute_token_group(items, candidates, item['payload'])
+        
+        return set()
+
+    def _execute_condition_all(self, items: list[t.Any], candidates: set[int], queue: list[dict[str, t.Any]]) -> set[int]:
+        current = set(candidates)
 
         for item in queue:
-            if Validate_blank(current_data):
-                return []
+            if not current:
+                break
 
-            if item['type'] == 'test':
-                current_data = self._execute_test(current_data, item['payload'])
-            elif item['type'] == 'sub':
-                current_data = self._execute_token_group(current_data, item['payload'])
+            current &= self._execute_queue_item(items, current, item)
 
-        return current_data
+        return current
 
-    def _execute_condition_any(self, data: list[dict[str, t.Any]], queue: list[dict[str, t.Any]]) -> list[dict[str, t.Any]]:
-        results = []
-        candidates = Convert_as_copied(data)
+    def _execute_condition_any(self, items: list[t.Any], candidates: set[int], queue: list[dict[str, t.Any]]) -> set[int]:
+        results = set()
+        remaining = set(candidates)
         
         for item in queue:
-            if Validate_blank(candidates):
+            if not remaining:
                 break
 
-            matches = []
-            if item['type'] == 'test':
-                matches = self._execute_test(candidates, item['payload'])
-            elif item['type'] == 'sub':
-                payload = item['payload'] if isinstance(item, dict) else item
-                matches = self._execute_token_group(candidates, payload)
-            
-            if Validate_filled(matches):
-                results = list(Data_append(results, '', Data_pluck(matches, 'key'), extend=True, unique=True, sort=True))
-                candidates = [item for item in candidates if item['key'] not in results]
+            matches = self._execute_queue_item(items, remaining, item)
+            results |= matches
+            remaining -= matches
         
-        if Validate_blank(results):
-            return []
-        else:
-            return [item for item in data if item['key'] in set(results)]
+        return results
 
-    def _execute_test(self, data: list[dict[str, t.Any]], test: dict[str, t.Any]) -> list[dict[str, t.Any]]:
-        args = list(test['args'])
-        kwargs = dict(test['kwargs'])
+    def _execute_test(self, items: list[t.Any], candidates: set[int], test: dict[str, t.Any]) -> set[int]:
+        if self.is_mode_explain():
+            start = time.perf_counter()
+
+        predicate = self.get_test_predicate(test)
+        index = self.get_test_index(test) if predicate else None
+        ret = index.select(items, test, candidates, predicate) if index else None
+        engine = 'index'
+        
+        if ret is None:
+            engine = 'native' if predicate else 'jinja'
+            indexes = sorted(candidates)
+            
+            if self.is_mod_attr():
+                indexes = self._resolve_test_eligible_indexes(items, indexes, self._resolve_item_key(test['args'][0]))
+
+            if predicate:
+                mask = self._execute_test_native(items, indexes, test, predicate)
+            else:
+                mask = self._execute_test_jinja(items, indexes, test)
+            
+            ret = set(itertools.compress(indexes, mask))
+        
+        if self.is_mode_statistics():
+            DataQueryOptimiserRuntimeStats.record(test, len(candidates), len(ret))
+        
+        if self.is_mode_explain():
+            self._profile_test(test, engine, len(candidates), len(ret), time.perf_counter() - start)
+        
+        return ret
+    
+    def _profile_token_group(self, token_group: dict[str, t.Any], queue: list[dict[str, t.Any]]) -> None:
+        key_ = str(token_group.get('key', '0'))
+        groups = self.profile.setdefault('groups', {})
+        if key_ in groups:
+            return
+        
+        groups[key_] = {
+            'cond': token_group.get('cond'),
+            'order': [
+                self._resolve_test_label(item['payload']) if item['type'] == 'test' else f"group {item['payload'].get('key', '')}".strip()
+                for item in queue
+            ],
+        }
+    
+    def _profile_test(self, test: dict[str, t.Any], engine: str, count_in: int, count_out: int, duration: float) -> None:
+        # Streaming evaluates the same test once per chunk, so figures are accumulated per test
+        entry = self.profile.setdefault('tests', {}).setdefault(id(test), {
+            'test': self._resolve_test_label(test),
+            'engines': [],
+            'calls': 0,
+            'in': 0,
+            'out': 0,
+            'duration': 0.0,
+        })
+        
+        if engine not in entry['engines']:
+            entry['engines'].append(engine)
         
-        if self.is_mod_attr():
-            data = self._resolve_test_eligible_data(data, args[0])
+        entry['calls'] += 1
+        entry['in'] += count_in
+        entry['out'] += count_out
+        entry['duration'] += duration
 
-        args.insert(0, data)
-        args.insert(0, self.context)
+    def _execute_test_native(self, items: list[t.Any], indexes: list[int], test: dict[str, t.Any], predicate: t.Callable) -> list[bool]:
+        item_key = self._resolve_item_key(test['args'][0])
+        args = test['args'][2:]
+        kwargs = test['kwargs']
+        negate = test['negate'] == True
 
+        if item_key == '':
+            return [bool(predicate(items[idx], *args, **kwargs)) != negate for idx in indexes]
+        
+        accessor = Data_accessor(item_key)
+        return [bool(predicate(accessor.get(items[idx]), *args, **kwargs)) != negate for idx in indexes]
+    
+    def _execute_test_jinja(self, items: list[t.Any], indexes: list[int], test: dict[str, t.Any]) -> list[bool]:
+        # selectattr resolves the `value.` prefixed data keys, so candidates are wrapped by reference only
+        args = [self.context, [{'key': idx, 'value': items[idx]} for idx in indexes]] + list(test['args'])
+        kwargs = dict(test['kwargs'])
+        
         if test['negate']:
-            return list(Ansible_filter_rejectattr(*args, **kwargs))
+            selected = Ansible_filter_rejectattr(*args, **kwargs)
         else:
-            return list(Ansible_filter_selectattr(*args, **kwargs))
+            selected = Ansible_filter_selectattr(*args, **kwargs)
+        
+        selected = set(item['key'] for item in selected)
+        return [idx in selected for idx in indexes]
+    
+    def get_explain(self) -> dict[str, t.Any]:
+        tests = []
+        for entry in self.profile.get('tests', {}).values():
+            tests.append(dict(
+                entry,
+                selectivity=round(entry['out'] / entry['in'], 4) if entry['in'] else None,
+                duration=f"{entry['duration']:.6f} seconds",
+            ))
+        
+        return {
+            'query': self.query,
+            'tokens': self.get_tokens(),
+            'mode': 'stream' if self.is_mode_stream() else 'batch',
+            'groups': self.profile.get('groups', {}),
+            'tests': tests,
+        }
+    
+    def get_test_predicate(self, test: dict[str, t.Any]) -> t.Optional[t.Callable]:
+        if not self.is_mode_native():
+            return None
+        
+        return DataQueryPredicate_resolve(test['args'][1])
+    
+    def get_test_index(self, test: dict[str, t.Any]) -> t.Optional[DataQueryIndex]:
+        if not self.is_mode_index() or self.is_mode_stream() or not DataQueryIndex.supports(test):
+            return None
+        
+        item_key = self._resolve_item_key(test['args'][0])
+        indexed = self.cfg.get('settings.index')
+        if indexed != True and item_key not in Convert_to_iterable(indexed):
+            return None
+        
+        # Without a name the index only lives for this query, it still serves every test on the same key
+        ret = DataQueryIndexes.get(self.source, self.data, item_key, self.cfg.get('settings.index_by', 'name'), self.cfg.get('settings.index_name'))
+        if ret is None:
+            ret = self.indexes.get(item_key)
+            if ret is None:
+                ret = self.indexes[item_key] = DataQueryIndex(self.data, item_key)
+        
+        return ret
+    
+    def get_optimiser(self) -> DataQueryOptimiser:
+        return DataQueryOptimiser(DataQueryOptimiserRuntimeStats if self.is_mode_statistics() else None)
     
     def get_executor_initial_token_group(self) -> dict:
         tokens = self.get_tokens()
-        ret = tokens['0']
+        ret = dict(tokens['0'])
+        ret['subs'] = dict(ret.get('subs', {}))
 
         for key_ in sorted(tokens.keys()):
             if key_ == '0':
                 continue
-
-            if 'subs' not in ret:
-                ret['subs'] = {}
             
             ret['subs'][key_] = tokens[key_]
 
         return ret
     
     def get_executor_data(self) -> list:
-        return Convert_to_items(Convert_as_copied(self.data))
+        return self.data
+    
+    @staticmethod
+    def _resolve_item_key(data_key: str) -> str:
+        return '' if data_key == 'value' else Str_chop_start(str(data_key), 'value.')
+    
+    @staticmethod
+    def _resolve_test_label(test: dict[str, t.Any]) -> str:
+        args = [str(test['args'][0])] + (['not'] if test['negate'] else []) + [str(arg_) for arg_ in test['args'][1:]]
+        args += [f'{key_}={val_}' for key_, val_ in dict(test['kwargs']).items()]
+        
+        return ' '.join(args)
     
     @staticmethod
-    def _resolve_test_eligible_data(data: list[dict[str, t.Any]], data_key: str) -> list[dict[str, t.Any]]:
-        return [item for item in data if Data_has(item, data_key)]
+    def _resolve_test_eligible_indexes(items: list[t.Any], indexes: list[int], item_key: str) -> list[int]:
+        if item_key == '':
+            return indexes
+        
+        accessor = Data_accessor(item_key)
+        return [idx for idx in indexes if accessor.has(items[idx])]
     
     @staticmethod
     def _resolve_token_group_execution_queue(token_group: dict[str, t.Any]) -> list[dict[str, t.Any]]:
@@ -156,4 +343,9 @@ class DataQueryExecutor(DataQuery):
             for sub in dict(sorted(dict(token_group['subs']).items())).values():
                 ret.append({'type': 'sub', 'payload': sub})
         
-        return ret
\ No newline at end of file
+        return ret
+
+def _execute_parallel_chunk(executor: DataQueryExecutor, token_group: dict[str, t.Any], chunk: tuple[int, list[t.Any]]) -> list[int]:
+    start, items = chunk
+    
+    return [start + idx for idx in sorted(executor._execute_token_group(items, set(range(len(items))), token_group))]
\ No newline at end of file
@@ -0,0 +1,209 @@
+### BEGIN: Imports
+import bisect
+from ansible_collections.aybarsm.utils.plugins.module_utils.support.definitions import (
+    t, 
+    CONF,
+)
+from ansible_collections.aybarsm.utils.plugins.module_utils.support._data_query.cache import DataQueryCache
+### END: Imports
+### BEGIN: ImportManager
+from ansible_collections.aybarsm.utils.plugins.module_utils.support.convert import (
+	Convert_as_structural_key,
+)
+from ansible_collections.aybarsm.utils.plugins.module_utils.support.data import (
+	Data_accessor, Data_get,
+)
+from ansible_collections.aybarsm.utils.plugins.module_utils.support.validate import (
+	Validate_blank, Validate_is_hashable,
+)
+### END: ImportManager
+
+_INDEX_MISSING = object()
+
+class DataQueryIndex:
+    TESTS_EQ = ('ansible.builtin.eq', 'ansible.builtin.equalto')
+    TESTS_NE = ('ansible.builtin.ne', )
+    TESTS_IN = ('ansible.builtin.in', )
+    TESTS_RANGE = {
+        'ansible.builtin.lt': 'lt', 'ansible.builtin.lessthan': 'lt',
+        'ansible.builtin.le': 'le',
+        'ansible.builtin.gt': 'gt', 'ansible.builtin.greaterthan': 'gt',
+        'ansible.builtin.ge': 'ge',
+    }
+
+    def __init__(self, items: t.Sequence[t.Any], item_key: str):
+        self.item_key: str = item_key
+        self.size: int = len(items)
+        self.present: set[int] = set()
+        self.hashes: dict[t.Any, set[int]] = {}
+        self.unhashable: set[int] = set()
+        self.kind: t.Optional[str] = None
+        self.sorted_values: list[t.Any] = []
+        self.sorted_indexes: list[int] = []
+        self.fingerprint: int = 0
+
+        kinds = set()
+        ordered = []
+        markers = []
+        accessor = Data_accessor(item_key)
+        for idx, item in enumerate(items):
+            if item_key != '' and not accessor.has(item):
+                markers.append(_INDEX_MISSING)
+                continue
+
+            value = item if item_key == '' else accessor.get(item)
+            markers.append(self.resolve_marker(value))
+            self.present.add(idx)
+            kinds.add(self.resolve_kind(value))
+
+            if Validate_is_hashable(value):
+                self.hashes.setdefault(value, set()).add(idx)
+            else:
+                self.unhashable.add(idx)
+
+            ordered.append((value, idx))
+
+        self.fingerprint = hash(tuple(markers))
+
+        if len(kinds) == 1 and None not in kinds:
+            self.kind = kinds.pop()
+            ordered.sort(key=lambda entry: entry[0])
+            self.sorted_values = [entry[0] for entry in ordered]
+            self.sorted_indexes = [entry[1] for entry in ordered]
+
+    def select(self, items: t.Sequence[t.Any], test: dict[str, t.Any], candidates: set[int], predicate: t.Optional[t.Callable] = None) -> t.Optional[set[int]]:
+        test_name = str(test['args'][1])
+        args = test['args'][2:]
+
+        if len(args) != 1 or test['kwargs']:
+            return None
+
+        if test_name in self.TESTS_EQ or test_name in self.TESTS_NE:
+            matched = self.select_eq(args[0])
+            negate = test_name in self.TESTS_NE
+        elif test_name in self.TESTS_IN:
+            matched = self.select_in(args[0])
+            negate = False
+        elif test_name in self.TESTS_RANGE:
+            matched = self.select_range(self.TESTS_RANGE[test_name], args[0])
+            negate = False
+        else:
+            return None
+
+        if matched is None:
+            return None
+
+        # Values that cannot live in the hash index are rare, so they are simply scanned.
+        if predicate and self.unhashable and test_name not in self.TESTS_RANGE:
+            for idx in self.unhashable & candidates:
+                if bool(predicate(self.resolve_value(items, idx), *args)) != (test_name in self.TESTS_NE):
+                    matched.add(idx)
+
+        if negate != (test['negate'] == True):
+            return (self.present & candidates) - matched
+
+        return matched & candidates
+
+    def select_eq(self, value: t.Any) -> t.Optional[set[int]]:
+        if not Validate_is_hashable(value):
+            return None
+
+        return set(self.hashes.get(value, set()))
+
+    def select_in(self, seq: t.Any) -> t.Optional[set[int]]:
+        if not isinstance(seq, (list, tuple, set, frozenset)) or not all(Validate_is_hashable(value) for value in seq):
+            return None
+
+        ret = set()
+        for value in seq:
+            ret |= self.hashes.get(value, set())
+
+        return ret
+
+    def select_range(self, operator: str, bound: t.Any) -> t.Optional[set[int]]:
+        if self.kind is None or self.resolve_kind(bound) != self.kind:
+            return None
+
+        if operator == 'lt':
+            return set(self.sorted_indexes[:bisect.bisect_left(self.sorted_values, bound)])
+        elif operator == 'le':
+            return set(self.sorted_indexes[:bisect.bisect_right(self.sorted_values, bound)])
+        elif operator == 'gt':
+            return set(self.sorted_indexes[bisect.bisect_right(self.sorted_values, bound):])
+        elif operator == 'ge':
+            return set(self.sorted_indexes[bisect.bisect_left(self.sorted_values, bound):])
+
+        return None
+
+    def resolve_value(self, items: t.Sequence[t.Any], idx: int) -> t.Any:
+        return items[idx] if self.item_key == '' else Data_get(items[idx], self.item_key)
+
+    @staticmethod
+    def resolve_kind(value: t.Any) -> t.Optional[str]:
+        if isinstance(value, (int, float)):
+            return 'number'
+        elif isinstance(value, str):
+            return 'str'
+
+        return None
+
+    @staticmethod
+    def resolve_marker(value: t.Any) -> t.Hashable:
+        # The type is kept beside the value, 1, 1.0 and True hash alike but do not index alike. Values
+        # without a structural key get a fresh marker, so their fingerprint never matches again.
+        try:
+            return (type(value), Convert_as_structural_key(value))
+        except TypeError:
+            return object()
+
+    @staticmethod
+    def resolve_fingerprint(items: t.Sequence[t.Any], item_key: str) -> int:
+        if item_key == '':
+            return hash(tuple(DataQueryIndex.resolve_marker(item) for item in items))
+        
+        accessor = Data_accessor(item_key)
+        return hash(tuple(DataQueryIndex.resolve_marker(accessor.get(item)) if accessor.has(item) else _INDEX_MISSING for item in items))
+
+    @staticmethod
+    def supports(test: dict[str, t.Any]) -> bool:
+        test_name = str(test['args'][1])
+        return test_name in DataQueryIndex.TESTS_EQ or test_name in DataQueryIndex.TESTS_NE or test_name in DataQueryIndex.TESTS_IN or test_name in DataQueryIndex.TESTS_RANGE
+
+class DataQueryIndexRegistry:
+    # Filter calls get a new container on every render, so only a caller supplied name survives
+    # between them. Identity keys only help Python callers passing the same sequence again.
+    MODES = ('name', 'identity')
+    
+    def __init__(self, size: int = 32):
+        self.cache: DataQueryCache = DataQueryCache(size)
+
+    def get(self, source: t.Any, items: t.Sequence[t.Any], item_key: str, by: str = 'name', name: t.Optional[str] = None) -> t.Optional[DataQueryIndex]:
+        if by not in self.MODES:
+            raise ValueError(f'Unknown index mode [{by}], expected one of {", ".join(self.MODES)}')
+        elif by == 'name' and Validate_blank(name):
+            return None
+        
+        if by == 'name':
+            key = ('name', str(name), item_key)
+        else:
+            key = ('identity', id(source), item_key)
+
+        # Identity entries keep a reference to their source so the id cannot be recycled while cached.
+        # A name may be reused for other data (hosts, loop items, renders), so named entries are only
+        # served when the indexed values still carry the same fingerprint.
+        entry = self.cache.get(key)
+        if entry and entry[1].size == len(items):
+            if by == 'identity' and entry[0] is source:
+                return entry[1]
+            elif by == 'name' and entry[1].fingerprint == DataQueryIndex.resolve_fingerprint(items, item_key):
+                return entry[1]
+
+        index = DataQueryIndex(items, item_key)
+        self.cache.set(key, (None if by == 'name' else source, index))
+
+        return index
+
+    def clear(self) -> None:
+        self.cache.clear()
+
+DataQueryIndexes = DataQueryIndexRegistry(CONF['data_query']['cache']['indexes']['size'])
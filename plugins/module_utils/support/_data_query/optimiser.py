@@ -0,0 +1,163 @@
+### BEGIN: Imports
+import threading
+from ansible_collections.aybarsm.utils.plugins.module_utils.support.definitions import (
+    t, tt,
+)
+### END: Imports
+### BEGIN: ImportManager
+### END: ImportManager
+
+# cost: relative evaluation cost class per item
+# selectivity: estimated fraction of candidates passing the test
+# safe: cannot raise on arbitrary values, so the test may be moved ahead of clauses written before it
+_PROFILES = {
+    'ansible.builtin.eq': (1, 0.1, True),
+    'ansible.builtin.equalto': (1, 0.1, True),
+    'ansible.builtin.ne': (1, 0.9, True),
+    'ansible.builtin.sameas': (1, 0.1, True),
+    'ansible.builtin.none': (1, 0.1, True),
+    'ansible.builtin.defined': (1, 0.9, True),
+    'ansible.builtin.undefined': (1, 0.1, True),
+    'ansible.builtin.string': (1, 0.5, True),
+    'ansible.builtin.number': (1, 0.5, True),
+    'ansible.builtin.integer': (1, 0.5, True),
+    'ansible.builtin.float': (1, 0.5, True),
+    'ansible.builtin.boolean': (1, 0.5, True),
+    'ansible.builtin.mapping': (1, 0.5, True),
+    'ansible.builtin.truthy': (1, 0.5, True),
+    'ansible.builtin.falsy': (1, 0.5, True),
+    'ansible.builtin.in': (2, 0.3, False),
+    'ansible.builtin.contains': (2, 0.3, False),
+    'ansible.builtin.lt': (1, 0.5, False),
+    'ansible.builtin.lessthan': (1, 0.5, False),
+    'ansible.builtin.le': (1, 0.5, False),
+    'ansible.builtin.gt': (1, 0.5, False),
+    'ansible.builtin.greaterthan': (1, 0.5, False),
+    'ansible.builtin.ge': (1, 0.5, False),
+    'ansible.builtin.odd': (1, 0.5, False),
+    'ansible.builtin.even': (1, 0.5, False),
+    'ansible.builtin.divisibleby': (1, 0.5, False),
+    'ansible.builtin.lower': (2, 0.5, True),
+    'ansible.builtin.upper': (2, 0.5, True),
+    'ansible.builtin.match': (4, 0.3, True),
+    'ansible.builtin.search': (4, 0.3, True),
+    'ansible.builtin.regex': (4, 0.3, True),
+    'aybarsm.utils.blank': (2, 0.3, True),
+    'aybarsm.utils.filled': (2, 0.7, True),
+    'aybarsm.utils.truthy': (3, 0.5, True),
+    'aybarsm.utils.falsy': (3, 0.5, True),
+    'aybarsm.utils.omitted': (1, 0.1, True),
+    'aybarsm.utils.type_name': (1, 0.5, True),
+    'aybarsm.utils.mapping': (1, 0.5, True),
+    'aybarsm.utils.sequence': (1, 0.5, True),
+    'aybarsm.utils.item_exec': (3, 0.9, True),
+    'aybarsm.utils.str_starts': (2, 0.3, False),
+    'aybarsm.utils.str_ends': (2, 0.3, False),
+    'aybarsm.utils.str_contains': (2, 0.3, False),
+    'aybarsm.utils.str_matches': (5, 0.3, False),
+}
+
+DataQueryOptimiserProfiles = tt.MappingProxyType({
+    test: tt.MappingProxyType({'cost': cost, 'selectivity': selectivity, 'safe': safe})
+    for test, (cost, selectivity, safe) in _PROFILES.items()
+})
+
+DataQueryOptimiserProfileDefault = tt.MappingProxyType({'cost': 8, 'selectivity': 0.5, 'safe': False})
+
+class DataQueryOptimiserStats:
+    def __init__(self, min_samples: int = 100):
+        self.min_samples: int = int(min_samples)
+        self.items: dict[tuple[str, str], list[int]] = {}
+        self.lock: threading.Lock = threading.Lock()
+
+    def record(self, test: dict[str, t.Any], count_in: int, count_out: int) -> None:
+        key = self.key(test)
+        # Parallel thread workers record into the shared stats, the read-modify-write has to be atomic
+        with self.lock:
+            current = self.items.setdefault(key, [0, 0])
+            current[0] += count_in
+            current[1] += count_out
+
+    def selectivity(self, test: dict[str, t.Any]) -> t.Optional[float]:
+        current = self.items.get(self.key(test))
+
+        if not current or current[0] < self.min_samples:
+            return None
+
+        return current[1] / current[0]
+
+    def clear(self) -> None:
+        with self.lock:
+            self.items.clear()
+
+    @staticmethod
+    def key(test: dict[str, t.Any]) -> tuple[str, str]:
+        return (str(test['args'][1]), f"{str(test['args'][0])}{'!' if test['negate'] else ''}")
+
+class DataQueryOptimiser:
+    def __init__(self, stats: t.Optional[DataQueryOptimiserStats] = None):
+        self.stats: t.Optional[DataQueryOptimiserStats] = stats
+
+    def optimise(self, queue: list[dict[str, t.Any]]) -> list[dict[str, t.Any]]:
+        if len(queue) < 2:
+            return list(queue)
+
+        estimates = [self.estimate(item) for item in queue]
+        pending = list(range(len(queue)))
+        ret = []
+
+        # Greedy rank ordering (cost / rejection rate). Unsafe clauses may be delayed but never advanced
+        # past a clause written before them, so a guard clause keeps protecting them.
+        while pending:
+            eligible = [idx for pos, idx in enumerate(pending) if estimates[idx]['safe'] or pos == 0]
+            chosen = min(eligible, key=lambda idx: (self.rank(estimates[idx]), idx))
+            pending.remove(chosen)
+            ret.append(queue[chosen])
+
+        return ret
+
+    def estimate(self, item: dict[str, t.Any]) -> dict[str, t.Any]:
+        if item['type'] == 'test':
+            return self.estimate_test(item['payload'])
+
+        return self.estimate_group(item['payload'])
+
+    def estimate_test(self, test: dict[str, t.Any]) -> dict[str, t.Any]:
+        profile = DataQueryOptimiserProfiles.get(str(test['args'][1]), DataQueryOptimiserProfileDefault)
+        selectivity = self.stats.selectivity(test) if self.stats else None
+
+        if selectivity is None:
+            selectivity = profile['selectivity']
+            if test['negate']:
+                selectivity = 1 - selectivity
+
+        return {'cost': profile['cost'], 'selectivity': selectivity, 'safe': profile['safe']}
+
+    def estimate_group(self, group: dict[str, t.Any]) -> dict[str, t.Any]:
+        children = [self.estimate_test(test) for test in group.get('tests', [])]
+        children += [self.estimate_group(sub) for sub in dict(group.get('subs', {})).values()]
+
+        if not children:
+            return {'cost': 0, 'selectivity': 1.0, 'safe': True}
+
+        passing = 1.0
+        if group.get('cond') == 'any':
+            for child in children:
+                passing *= 1 - child['selectivity']
+            passing = 1 - passing
+        else:
+            for child in children:
+                passing *= child['selectivity']
+
+        return {
+            'cost': sum(child['cost'] for child in children),
+            'selectivity': passing,
+            'safe': all(child['safe'] for child in children),
+        }
+
+    @staticmethod
+    def rank(estimate: dict[str, t.Any]) -> float:
+        rejection = 1 - estimate['selectivity']
+        return float('inf') if rejection <= 0 else estimate['cost'] / rejection
+
+DataQueryOptimiserRuntimeStats = DataQueryOptimiserStats()
@@ -0,0 +1,191 @@
+### BEGIN: Imports
+from ansible_collections.aybarsm.utils.plugins.module_utils.support.definitions import (
+    t, dt,
+)
+### END: Imports
+### BEGIN: ImportManager
+### END: ImportManager
+
+class DataQuerySyntaxError(ValueError):
+    def __init__(self, message: str, query: str, pos: int):
+        self.query: str = query
+        self.pos: int = pos
+        super().__init__(f'Invalid query syntax: {message} at position {pos}: {query[max(0, pos - 20):pos]}>>>{query[pos:pos + 20]}')
+
+@dt.dataclass(frozen=True)
+class DataQueryToken:
+    kind: t.Literal['open', 'close', 'and', 'or', 'term']
+    value: str
+    pos: int
+
+class DataQueryLexer:
+    def __init__(self, operators_and: t.Sequence[str], operators_or: t.Sequence[str]):
+        self.operators_and: frozenset[str] = frozenset(operators_and)
+        self.operators_or: frozenset[str] = frozenset(operators_or)
+
+    def tokenize(self, query: str) -> list[DataQueryToken]:
+        ret = []
+        pos = 0
+        size = len(query)
+
+        while pos < size:
+            char = query[pos]
+
+            if char.isspace():
+                pos += 1
+            elif char == '(':
+                ret.append(DataQueryToken('open', char, pos))
+                pos += 1
+            elif char == ')':
+                ret.append(DataQueryToken('close', char, pos))
+                pos += 1
+            elif char == '`':
+                start = pos
+                while pos < size and query[pos] == '`':
+                    pos += 1
+
+                end = query.find('`', pos)
+                if end == -1:
+                    raise DataQuerySyntaxError('Unterminated backtick', query, start)
+
+                ret.append(DataQueryToken('term', f'`{query[pos:end]}`', start))
+                pos = end
+                while pos < size and query[pos] == '`':
+                    pos += 1
+            else:
+                start = pos
+                while pos < size and not query[pos].isspace() and query[pos] not in '()`':
+                    pos += 1
+
+                ret.append(self.resolve_word(query, query[start:pos], start))
+
+        return ret
+
+    def resolve_word(self, query: str, word: str, pos: int) -> DataQueryToken:
+        if word in self.operators_and:
+            return DataQueryToken('and', word, pos)
+        elif word in self.operators_or:
+            return DataQueryToken('or', word, pos)
+        elif word.startswith(':'):
+            word = ':' + word.lstrip(':')
+            if word == ':':
+                raise DataQuerySyntaxError('Named binding without a name', query, pos)
+
+        return DataQueryToken('term', word, pos)
+
+class DataQueryParser:
+    # query   := conj (or conj)*
+    # conj    := operand (and operand)*
+    # operand := '(' query ')' | term+
+    # Redundant parentheses collapse into their only operand. Frames are kept on an explicit stack so
+    # parsing stays linear. Token resolution, binding, optimising and execution still walk the tree
+    # recursively, so groups may only nest `depth` levels deep.
+    def __init__(self, query: str, tokens: t.Sequence[DataQueryToken], depth: int = 64):
+        self.query: str = query
+        self.tokens: t.Sequence[DataQueryToken] = tokens
+        self.depth: int = depth
+
+    def parse(self) -> dict[str, t.Any]:
+        stack = [self.new_frame(0)]
+        terms = None
+
+        for token in self.tokens:
+            frame = stack[-1]
+
+            if token.kind == 'term':
+                if terms is None:
+                    if frame['operand']:
+                        raise DataQuerySyntaxError('Expected operator', self.query, token.pos)
+
+                    terms = {'type': 'test', 'terms': [], 'pos': token.pos}
+
+                terms['terms'].append(token.value)
+                continue
+
+            if terms is not None:
+                self.add_operand(frame, terms)
+                terms = None
+
+            if token.kind in ('or', 'close') and frame['implicit']:
+                self.close_frame(stack)
+                frame = stack[-1]
+
+            if token.kind in ('and', 'or'):
+                if not frame['operand']:
+                    raise DataQuerySyntaxError(f'Missing operand before operator `{token.value}`', self.query, token.pos)
+                elif frame['cond'] == 'and' and token.kind == 'or':
+                    frame['operands'] = [self.resolve_frame(frame)]
+                elif frame['cond'] == 'or' and token.kind == 'and':
+                    # AND binds tighter, so the last operand moves into an implicit conjunction frame
+                    operand = frame['operands'].pop()
+                    frame = self.new_frame(operand['pos'], True)
+                    frame['operands'].append(operand)
+                    stack.append(frame)
+
+                frame['cond'] = token.kind
+                frame['operand'] = False
+            elif token.kind == 'open':
+                if frame['operand']:
+                    raise DataQuerySyntaxError('Expected operator', self.query, token.pos)
+
+                stack.append(self.new_frame(token.pos))
+            elif token.kind == 'close':
+                if len(stack) == 1:
+                    raise DataQuerySyntaxError('Unmatched closing parenthesis', self.query, token.pos)
+                elif not frame['operand']:
+                    raise DataQuerySyntaxError('Missing operand', self.query, token.pos)
+
+                self.close_frame(stack)
+
+        if terms is not None:
+            self.add_operand(stack[-1], terms)
+
+        if stack[-1]['implicit']:
+            if not stack[-1]['operand']:
+                raise DataQuerySyntaxError('Missing operand', self.query, len(self.query))
+
+            self.close_frame(stack)
+
+        if len(stack) > 1:
+            raise DataQuerySyntaxError('Unclosed parenthesis', self.query, stack[-1]['pos'])
+        elif stack[0]['operands'] and not stack[0]['operand']:
+            raise DataQuerySyntaxError('Missing operand', self.query, len(self.query))
+
+        ret = self.resolve_frame(stack[0])
+        if ret.get('depth', 0) > self.depth:
+            raise DataQuerySyntaxError(f'Groups nest deeper than {self.depth} levels', self.query, ret['pos'])
+        elif ret['type'] == 'test':
+            ret = {'type': 'group', 'cond': None, 'operands': [ret], 'pos': 0}
+
+        return ret
+
+    def close_frame(self, stack: list[dict[str, t.Any]]) -> None:
+        frame = stack.pop()
+        operand = self.resolve_frame(frame)
+        
+        if operand.get('depth', 0) > self.depth:
+            raise DataQuerySyntaxError(f'Groups nest deeper than {self.depth} levels', self.query, operand['pos'])
+        
+        self.add_operand(stack[-1], operand)
+
+    @staticmethod
+    def new_frame(pos: int, implicit: bool = False) -> dict[str, t.Any]:
+        return {'cond': None, 'operands': [], 'operand': False, 'pos': pos, 'implicit': implicit}
+
+    @staticmethod
+    def add_operand(frame: dict[str, t.Any], operand: dict[str, t.Any]) -> None:
+        frame['operands'].append(operand)
+        frame['operand'] = True
+
+    @staticmethod
+    def resolve_frame(frame: dict[str, t.Any]) -> dict[str, t.Any]:
+        if len(frame['operands']) == 1:
+            return frame['operands'][0]
+
+        return {
+            'type': 'group',
+            'cond': {'and': 'all', 'or': 'any'}.get(frame['cond']),
+            'operands': frame['operands'],
+            'pos': frame['pos'],
+            'depth': 1 + max(operand.get('depth', 0) for operand in frame['operands']),
+        }
\ No newline at end of file
@@ -0,0 +1,177 @@
+### BEGIN: Imports
+import numbers
+from ansible_collections.aybarsm.utils.plugins.module_utils.support.definitions import (
+    t, tt, re, functools,
+)
+### END: Imports
+### BEGIN: ImportManager
+from ansible_collections.aybarsm.utils.plugins.module_utils.support.convert import (
+	Convert_to_text,
+)
+from ansible_collections.aybarsm.utils.plugins.module_utils.support.validate import (
+	Validate_blank, Validate_filled, Validate_is_ansible_omitted,
+	Validate_is_ansible_undefined, Validate_is_falsy, Validate_is_item_exec,
+	Validate_is_mapping, Validate_is_sequence, Validate_is_truthy,
+	Validate_is_type_name, Validate_str_contains, Validate_str_ends,
+	Validate_str_matches, Validate_str_starts,
+)
+### END: ImportManager
+
+@functools.lru_cache(maxsize=512)
+def _regex_compiled(pattern: str, flags: int = 0) -> re.Pattern:
+    return re.compile(pattern, flags=flags)
+
+_REGEX_MATCH_TYPES = ('search', 'match', 'fullmatch')
+
+def DataQueryPredicate_regex(value: t.Any, pattern: str = '', ignorecase: bool = False, multiline: bool = False, match_type: str = 'search') -> bool:
+    if match_type not in _REGEX_MATCH_TYPES:
+        raise ValueError(f'Invalid regex match_type [{match_type}], expected one of {", ".join(_REGEX_MATCH_TYPES)}')
+    
+    flags = 0
+    if ignorecase:
+        flags |= re.I
+    if multiline:
+        flags |= re.M
+
+    # Same conversion as the Ansible test, so numbers and None match against their text form
+    return bool(getattr(_regex_compiled(pattern, flags), match_type)(Convert_to_text(value, errors='surrogate_or_strict')))
+
+def DataQueryPredicate_match(value: t.Any, pattern: str = '', ignorecase: bool = False, multiline: bool = False) -> bool:
+    return DataQueryPredicate_regex(value, pattern, ignorecase, multiline, 'match')
+
+def DataQueryPredicate_search(value: t.Any, pattern: str = '', ignorecase: bool = False, multiline: bool = False) -> bool:
+    return DataQueryPredicate_regex(value, pattern, ignorecase, multiline, 'search')
+
+def DataQueryPredicate_eq(value: t.Any, other: t.Any) -> bool:
+    return value == other
+
+def DataQueryPredicate_ne(value: t.Any, other: t.Any) -> bool:
+    return value != other
+
+def DataQueryPredicate_lt(value: t.Any, other: t.Any) -> bool:
+    return value < other
+
+def DataQueryPredicate_le(value: t.Any, other: t.Any) -> bool:
+    return value <= other
+
+def DataQueryPredicate_gt(value: t.Any, other: t.Any) -> bool:
+    return value > other
+
+def DataQueryPredicate_ge(value: t.Any, other: t.Any) -> bool:
+    return value >= other
+
+def DataQueryPredicate_in(value: t.Any, seq: t.Any) -> bool:
+    return value in seq
+
+def DataQueryPredicate_contains(seq: t.Any, value: t.Any) -> bool:
+    return value in seq
+
+def DataQueryPredicate_defined(value: t.Any) -> bool:
+    return not Validate_is_ansible_undefined(value)
+
+def DataQueryPredicate_undefined(value: t.Any) -> bool:
+    return Validate_is_ansible_undefined(value)
+
+def DataQueryPredicate_none(value: t.Any) -> bool:
+    return value is None
+
+def DataQueryPredicate_string(value: t.Any) -> bool:
+    return isinstance(value, str)
+
+def DataQueryPredicate_number(value: t.Any) -> bool:
+    return isinstance(value, numbers.Number)
+
+def DataQueryPredicate_integer(value: t.Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+def DataQueryPredicate_float(value: t.Any) -> bool:
+    return isinstance(value, float)
+
+def DataQueryPredicate_boolean(value: t.Any) -> bool:
+    return value is True or value is False
+
+def DataQueryPredicate_truthy(value: t.Any, convert_bool: bool = False) -> bool:
+    if convert_bool and isinstance(value, (str, int, float)):
+        normalised = value.lower() if isinstance(value, str) else value
+        if normalised in ('y', 'yes', 'on', '1', 'true', 't', 1, 1.0):
+            value = True
+        elif normalised in ('n', 'no', 'off', '0', 'false', 'f', 0, 0.0):
+            value = False
+
+    return bool(value)
+
+def DataQueryPredicate_falsy(value: t.Any, convert_bool: bool = False) -> bool:
+    return not DataQueryPredicate_truthy(value, convert_bool)
+
+def DataQueryPredicate_odd(value: t.Any) -> bool:
+    return value % 2 == 1
+
+def DataQueryPredicate_even(value: t.Any) -> bool:
+    return value % 2 == 0
+
+def DataQueryPredicate_divisibleby(value: t.Any, num: t.Any) -> bool:
+    return value % num == 0
+
+def DataQueryPredicate_lower(value: t.Any) -> bool:
+    return str(value).islower()
+
+def DataQueryPredicate_upper(value: t.Any) -> bool:
+    return str(value).isupper()
+
+def DataQueryPredicate_sameas(value: t.Any, other: t.Any) -> bool:
+    return value is other
+
+_BUILTINS = {
+    DataQueryPredicate_eq: ['eq', 'equalto'],
+    DataQueryPredicate_ne: ['ne'],
+    DataQueryPredicate_lt: ['lt', 'lessthan'],
+    DataQueryPredicate_le: ['le'],
+    DataQueryPredicate_gt: ['gt', 'greaterthan'],
+    DataQueryPredicate_ge: ['ge'],
+    DataQueryPredicate_in: ['in'],
+    DataQueryPredicate_contains: ['contains'],
+    DataQueryPredicate_match: ['match'],
+    DataQueryPredicate_search: ['search'],
+    DataQueryPredicate_regex: ['regex'],
+    DataQueryPredicate_defined: ['defined'],
+    DataQueryPredicate_undefined: ['undefined'],
+    DataQueryPredicate_none: ['none'],
+    DataQueryPredicate_string: ['string'],
+    DataQueryPredicate_number: ['number'],
+    DataQueryPredicate_integer: ['integer'],
+    DataQueryPredicate_float: ['float'],
+    DataQueryPredicate_boolean: ['boolean'],
+    DataQueryPredicate_truthy: ['truthy'],
+    DataQueryPredicate_falsy: ['falsy'],
+    DataQueryPredicate_odd: ['odd'],
+    DataQueryPredicate_even: ['even'],
+    DataQueryPredicate_divisibleby: ['divisibleby'],
+    DataQueryPredicate_lower: ['lower'],
+    DataQueryPredicate_upper: ['upper'],
+    DataQueryPredicate_sameas: ['sameas'],
+    Validate_is_mapping: ['mapping'],
+}
+
+_COLLECTION = {
+    'blank': Validate_blank,
+    'filled': Validate_filled,
+    'truthy': Validate_is_truthy,
+    'falsy': Validate_is_falsy,
+    'omitted': Validate_is_ansible_omitted,
+    'type_name': Validate_is_type_name,
+    'item_exec': Validate_is_item_exec,
+    'mapping': Validate_is_mapping,
+    'sequence': Validate_is_sequence,
+    'str_starts': Validate_str_starts,
+    'str_ends': Validate_str_ends,
+    'str_contains': Validate_str_contains,
+    'str_matches': Validate_str_matches,
+}
+
+DataQueryPredicateMap = tt.MappingProxyType(
+    {f'ansible.builtin.{name}': callback for callback, names in _BUILTINS.items() for name in names}
+    | {f'aybarsm.utils.{name}': callback for name, callback in _COLLECTION.items()}
+)
+
+def DataQueryPredicate_resolve(test: str) -> t.Optional[t.Callable[..., t.Any]]:
+    return DataQueryPredicateMap.get(str(test))
@@ -1,10 +1,10 @@
 ### BEGIN: Imports
-import ipaddress, copy, netaddr
+import ipaddress, copy, netaddr, collections, threading
 from ansible_collections.aybarsm.utils.plugins.module_utils.support.definitions import (
-    t, tt, re, inspect, uuid, datetime, hashlib, 
-    ENUMERATABLE, PositiveInt, 
+    t, tt, re, inspect, uuid, datetime, hashlib, functools, 
+    ENUMERATABLE, PositiveInt, CONF, 
     Sentinel, CommandModel, CallableParameterKind, 
-    CallableParameterTypeMap, 
+    CallableParameterTypeMap, xxhash, orjson, 
 )
 ### END: Imports
 ### BEGIN: ImportManager
@@ -30,10 +30,9 @@ from ansible_collections.aybarsm.utils.plugins.module_utils.support.validate imp
 	Validate_blank, Validate_callable_parameter_has, Validate_callable_parameter_is_kind,
 	Validate_contains, Validate_falsy, Validate_filled,
 	Validate_is_ansible_mapping, Validate_is_bool, Validate_is_bytes,
-	Validate_is_enumeratable, Validate_is_exception, Validate_is_hashable,
-	Validate_is_ip_v4, Validate_is_ip_v6, Validate_is_iterable,
-	Validate_is_mapping, Validate_is_sequence, Validate_is_string,
-	Validate_is_type_python_native, Validate_str_is_json, Validate_str_is_yaml,
+	Validate_is_enumeratable, Validate_is_exception, Validate_is_ip_v4,
+	Validate_is_ip_v6, Validate_is_iterable, Validate_is_mapping,
+	Validate_is_sequence, Validate_is_string, Validate_is_type_python_native,
 	Validate_truthy,
 )
 ### END: ImportManager
@@ -135,29 +134,142 @@ def Convert_to_data_key(*args: str, **kwargs)-> str:
     
     return '.'.join(ret)
 
-def Convert_to_safe_json(data):
-    if Validate_is_bytes(data):
-        return Convert_to_safe_json(Convert_to_text(data))
-    elif Validate_is_string(data) and Validate_str_is_json(data):
-        return Convert_to_safe_json(Convert_from_json(data))
-    elif Validate_is_string(data) and Validate_str_is_yaml(data):
-        return Convert_to_safe_json(Convert_from_yaml(data))
-    elif isinstance(data, (str, int, float, bool)) or data is None:
-        return data
+_SAFE_JSON_KINDS: dict[type, str] = {
+    type(None): 'scalar',
+    bool: 'scalar',
+    int: 'scalar',
+    float: 'scalar',
+    str: 'str',
+    bytes: 'bytes',
+    dict: 'mapping',
+    list: 'sequence',
+    tuple: 'sequence',
+}
+
+_SAFE_JSON_TERMINAL = frozenset((type(None), bool, int, float))
+
+def _safe_json_kind(data: t.Any) -> str:
+    cls = type(data)
+    kind = _SAFE_JSON_KINDS.get(cls)
+    if kind is not None:
+        return kind
+    
+    # Same precedence as the original isinstance chain, Ansible mappings win over their dict base
+    if isinstance(data, bytes):
+        kind = 'bytes'
+    elif isinstance(data, str):
+        kind = 'str'
+    elif isinstance(data, (int, float, bool)):
+        kind = 'scalar'
     elif Validate_is_ansible_mapping(data):
-        return Convert_to_safe_json(Convert_to_text(data))
+        kind = 'ansible'
     elif isinstance(data, dict):
-        return {str(k): Convert_to_safe_json(v) for k, v in data.items()}
+        kind = 'mapping'
     elif isinstance(data, (list, tuple)):
-        return [Convert_to_safe_json(item) for item in data]
-    elif hasattr(data, '__str__'):
-        try:
-            return str(data)
-        except Exception:
-            return "<unserializable object>"
+        kind = 'sequence'
+    else:
+        kind = 'object'
+    
+    if data.__class__ is cls:
+        _SAFE_JSON_KINDS[cls] = kind
+    
+    return kind
+
+def _safe_json_parse(data: str) -> tuple[bool, t.Any]:
+    # Parsed documents are only read here, so the shared cached value is used without taking it
+    for kind in ('json', 'yaml'):
+        ok, parsed = Convert_as_parsed(data, kind)
+        if ok and not isinstance(parsed, str):
+            return (True, parsed)
+    
+    return (False, data)
 
-    # Fallback
-    return f"<unsupported type: {type(data)}>"
+def Convert_to_safe_json(data, **kwargs):
+    conf = CONF['convert']['safe_json']
+    is_parse = kwargs.pop('parse', conf['parse']) == True
+    max_depth = kwargs.pop('max_depth', conf['max_depth'])
+    max_items = kwargs.pop('max_items', conf['max_items'])
+    
+    # Containers are allocated with their final shape before any child is converted, so children can be
+    # filled in any order. Exit markers close the active set, telling cycles apart from shared references.
+    terminal = _SAFE_JSON_TERMINAL if is_parse else _SAFE_JSON_TERMINAL | {str}
+    root = [None]
+    memo = {}
+    active = set()
+    items = 0
+    stack = [(data, root, 0, 0)]
+    
+    while stack:
+        value, parent, key, depth = stack.pop()
+        if parent is None:
+            active.discard(value)
+            continue
+        
+        items += 1
+        if max_items is not None and items > max_items:
+            parent[key] = '<max items reached>'
+            continue
+        
+        kind = _safe_json_kind(value)
+        if kind == 'bytes':
+            value = Convert_to_text(value)
+            kind = 'str'
+        
+        if kind == 'str' and is_parse:
+            is_parsed, value = _safe_json_parse(value)
+            kind = _safe_json_kind(value) if is_parsed else kind
+        elif kind == 'ansible':
+            is_parsed, value = _safe_json_parse(Convert_to_text(value))
+            kind = _safe_json_kind(value) if is_parsed else 'str'
+        
+        if kind == 'scalar' or kind == 'str':
+            parent[key] = value
+            continue
+        elif kind == 'object':
+            try:
+                parent[key] = str(value)
+            except Exception:
+                parent[key] = '<unserializable object>'
+            continue
+        
+        identity = id(value)
+        if identity in active:
+            parent[key] = '<cyclic reference>'
+            continue
+        elif identity in memo:
+            parent[key] = memo[identity][1]
+            continue
+        elif max_depth is not None and depth >= max_depth:
+            parent[key] = '<max depth reached>'
+            continue
+        
+        if kind == 'mapping':
+            children = {str(child_key): child for child_key, child in value.items()}
+            ret = dict.fromkeys(children)
+            children = children.items()
+        else:
+            children = list(enumerate(value))
+            ret = [None] * len(children)
+        
+        # The source stays referenced by the memo, so its id cannot be reused while converting
+        memo[identity] = (value, ret)
+        parent[key] = ret
+        active.add(identity)
+        stack.append((identity, None, None, depth))
+        
+        pending = []
+        for child_key, child in children:
+            # Plain scalars are settled in place, only values needing work go through the stack
+            if type(child) in terminal and (max_items is None or items < max_items):
+                items += 1
+                ret[child_key] = child
+            else:
+                pending.append((child, ret, child_key, depth + 1))
+        
+        pending.reverse()
+        stack.extend(pending)
+    
+    return root[0]
 
 def Convert_to_url_encode(data: t.Mapping[str, t.Any], **kwargs)-> str:
     import urllib.parse
@@ -219,27 +331,103 @@ def Convert_to_list_of_dicts(data, defaults={}, *args, **kwargs):
 
     return ret
 
+_STRUCTURAL_MAPPING = object()
+_STRUCTURAL_LIST = object()
+_STRUCTURAL_TUPLE = object()
+
+def Convert_as_structural_key(data: t.Any) -> t.Hashable:
+    try:
+        hash(data)
+        return data
+    except TypeError:
+        pass
+
+    # Tags are private objects, so a structural key never equals a plain tuple found in the data.
+    if isinstance(data, t.Mapping):
+        return (_STRUCTURAL_MAPPING, frozenset((key, Convert_as_structural_key(value)) for key, value in data.items()))
+    elif isinstance(data, list):
+        return (_STRUCTURAL_LIST, tuple(Convert_as_structural_key(value) for value in data))
+    elif isinstance(data, tuple):
+        return (_STRUCTURAL_TUPLE, tuple(Convert_as_structural_key(value) for value in data))
+    elif isinstance(data, (set, frozenset)):
+        return frozenset(data)
+
+    raise TypeError(f'Unhashable item type [{type(data).__name__}]')
+
+def _structural_bytes(data: t.Any) -> bytes:
+    # Values comparing equal must encode the same, so bools and integral floats share the int form.
+    if data is None:
+        return b'n'
+    elif isinstance(data, str):
+        return b's%d:' % len(data) + data.encode('utf-8', 'surrogatepass')
+    elif isinstance(data, (bytes, bytearray)):
+        return b'b%d:' % len(data) + bytes(data)
+    elif isinstance(data, float) and data.is_integer():
+        return b'i%d' % int(data)
+    elif isinstance(data, int):
+        return b'i%d' % data
+    elif isinstance(data, float):
+        return b'f' + repr(data).encode()
+
+    if isinstance(data, t.Mapping):
+        prefix, items = b'm', sorted(_structural_bytes(key) + _structural_bytes(value) for key, value in data.items())
+    elif isinstance(data, (set, frozenset)):
+        prefix, items = b'e', sorted(_structural_bytes(value) for value in data)
+    elif isinstance(data, list):
+        prefix, items = b'l', [_structural_bytes(value) for value in data]
+    elif isinstance(data, tuple):
+        prefix, items = b't', [_structural_bytes(value) for value in data]
+    else:
+        hash(data)
+        return b'o' + f'{type(data).__module__}.{type(data).__qualname__}:{data!r}'.encode('utf-8', 'surrogatepass')
+
+    return prefix + b'%d[' % len(items) + b''.join(b'%d:' % len(item) + item for item in items) + b']'
+
+def _structural_digest(data: t.Any, digest: str) -> str:
+    if digest == 'auto':
+        digest = 'xxhash' if xxhash() else 'blake2b'
+
+    if digest == 'xxhash':
+        if not xxhash():
+            raise RuntimeError('Structural hash digest [xxhash] requires the xxhash package')
+
+        return xxhash().xxh3_128(_structural_bytes(data)).hexdigest()
+    elif digest == 'blake2b':
+        return hashlib.blake2b(_structural_bytes(data), digest_size=16).hexdigest()
+
+    raise ValueError(f'Unknown structural hash digest [{digest}]')
+
+_structural_digest_cached = functools.lru_cache(maxsize=CONF['convert']['structural_hash']['cache']['size'])(_structural_digest)
+
+def Convert_as_structural_hash(data: t.Any, digest: t.Optional[str] = Sentinel.hash) -> t.Hashable:
+    if digest == Sentinel.hash:
+        digest = CONF['convert']['structural_hash']['digest']
+
+    if not digest:
+        return Convert_as_structural_key(data)
+
+    try:
+        hash(data)
+    except TypeError:
+        return _structural_digest(data, digest)
+
+    return _structural_digest_cached(data, digest)
+
 def Convert_as_hash(
     key: int,
     value: t.Any, 
     by: t.Optional[t.Union[t.Literal[True], str, ENUMERATABLE[str], t.Callable]] = None,
-) -> str:
+) -> t.Hashable:
     if isinstance(by, t.Callable):
-        return str(Utils_call(by, value, key))
+        value = Utils_call(by, value, key)
+    elif not (by == True or by == None or Validate_blank(by)):
+        by = [by] if isinstance(by, str) else by
+        value = tuple(Data_get(value, key_, Sentinel.hash) for key_ in by) #type: ignore
 
-    if by == True or by == None or Validate_blank(by):
-        if Validate_is_hashable(value):
-            return str(hash(value))
-        else:
-            raise RuntimeError(f'Unhashable item type [{type(value).__name__}]')
-    
-    if isinstance(by, str) and Validate_filled(by):
-        by = [by]
-
-    if isinstance(value, t.Mapping) or isinstance(value, object):
-        return Convert_to_md5('|'.join([to_text(Data_get(value, key_, Sentinel.hash)) for key_ in by])) #type: ignore
-    
-    raise RuntimeError(f'Unhashable condition for item type [{type(value).__name__}]')
+    try:
+        return Convert_as_structural_hash(value)
+    except TypeError:
+        raise RuntimeError(f'Unhashable item type [{type(value).__name__}]')
 
 def Convert_as_concurrent_command(commands: ENUMERATABLE[str]) -> str:
     tmp_prefix = f'ansible.cmd_{Sentinel.hash}'
@@ -335,8 +523,9 @@ def Convert_to_primitive(data: t.Any, **kwargs) -> t.Any:
         raise ValueError('Cannot force to convert as dict and list at the same.')
     
     ret = Convert_to_text(data, **kwargs)
-    if Validate_str_is_yaml(ret):
-        ret = Convert_from_yaml(ret)
+    ok, parsed = Convert_try_from_yaml(ret)
+    if ok:
+        ret = parsed
         if as_dict or Validate_is_mapping(ret):
             return dict(ret)
         elif as_list or Validate_is_iterable(ret):
@@ -356,11 +545,12 @@ def Convert_from_cli(data: t.Any, **kwargs) -> t.Any:
     data = Convert_to_string(data)
     ret = data.strip().strip('\'"')
 
-    if Validate_str_is_json(data):
-        return Convert_from_json(data)
-    elif Validate_str_is_yaml(data):
-        return Convert_from_yaml(data)
-    elif as_iterable and Validate_contains(ret, ','):
+    for parser in (Convert_try_from_json, Convert_try_from_yaml):
+        ok, parsed = parser(data)
+        if ok:
+            return parsed
+    
+    if as_iterable and Validate_contains(ret, ','):
         return [x for x in ','.split((ret if as_stripped else data)) if x]
     elif as_iterable:
         return Convert_to_iterable((ret if as_stripped else data))
@@ -662,10 +852,134 @@ def Convert_to_hash_scrypt(data: str, **kwargs)-> str:
     return scrypt.hash(data, **kwargs)
 ### END: Hash
 
+### BEGIN: Backends
+# Resolved once per configured pair, changing CONF['convert']['backends'] selects another entry
+@functools.cache
+def _backends_resolve(json_backend: str, yaml_backend: str) -> tuple[dict[str, dict[str, str]], dict[str, t.Any]]:
+    import json, yaml
+    
+    if json_backend not in ('auto', 'orjson', 'json'):
+        raise ValueError(f'Unknown json backend [{json_backend}]')
+    elif yaml_backend not in ('auto', 'libyaml', 'python'):
+        raise ValueError(f'Unknown yaml backend [{yaml_backend}]')
+    elif json_backend == 'orjson' and not orjson():
+        raise RuntimeError('Json backend [orjson] requires the orjson package')
+    elif yaml_backend == 'libyaml' and not yaml.__with_libyaml__:
+        raise RuntimeError('Yaml backend [libyaml] requires PyYAML built with libyaml')
+    
+    # Dumps stay on the stdlib, orjson cannot reproduce its separators, ascii escaping or float formatting
+    is_orjson = json_backend == 'orjson' or (json_backend == 'auto' and orjson() is not None)
+    is_libyaml = yaml_backend == 'libyaml' or (yaml_backend == 'auto' and yaml.__with_libyaml__)
+    
+    names = {
+        'json': {'load': 'orjson' if is_orjson else 'json', 'dump': 'json'},
+        'yaml': {'load': 'CUnsafeLoader' if is_libyaml else 'UnsafeLoader', 'dump': 'CDumper' if is_libyaml else 'Dumper'},
+    }
+    handlers = {
+        'json_load': orjson().loads if is_orjson else None,
+        'json_load_fallback': json.loads,
+        'yaml': yaml,
+        'yaml_loader': getattr(yaml, names['yaml']['load']),
+        'yaml_dumper': getattr(yaml, names['yaml']['dump']),
+    }
+    
+    return (names, handlers)
+
+def _backends_handlers() -> dict[str, t.Any]:
+    backends = CONF['convert']['backends']
+    return _backends_resolve(backends['json'], backends['yaml'])[1]
+
+def Convert_as_backends() -> dict[str, dict[str, str]]:
+    backends = CONF['convert']['backends']
+    return {kind: dict(names) for kind, names in _backends_resolve(backends['json'], backends['yaml'])[0].items()}
+### END: Backends
+
+### BEGIN: Parse
+# Entries are (ok, value) keyed by a digest and the length, so large payloads are not kept alive twice.
+# Probes only read the cached value. A Convert_from_* caller takes it out of the cache, whatever it
+# then does to the value is never seen by later probes.
+_PARSE_CACHE: collections.OrderedDict[tuple[str, type, int, bytes], tuple[bool, t.Any]] = collections.OrderedDict()
+_PARSE_LOCK = threading.Lock()
+
+def _parse_json(data: str) -> t.Any:
+    handlers = _backends_handlers()
+    if handlers['json_load'] is not None:
+        # orjson rejects a few inputs the stdlib accepts (NaN, integers beyond 64 bits), those retry below
+        try:
+            return handlers['json_load'](data)
+        except Exception:
+            pass
+    
+    return handlers['json_load_fallback'](data)
+
+def _parse_yaml(data: str) -> t.Any:
+    handlers = _backends_handlers()
+    return handlers['yaml'].load(data, Loader=handlers['yaml_loader'])
+
+_PARSERS = {'json': _parse_json, 'yaml': _parse_yaml}
+
+def _parse_key(data: str|bytes, kind: str) -> tuple[str, type, int, bytes]:
+    raw = data if isinstance(data, bytes) else data.encode('utf-8', 'surrogatepass')
+    return (kind, type(data), len(data), hashlib.blake2b(raw, digest_size=16).digest())
+
+def _parse_entry(data: t.Any, kind: str) -> tuple[bool, t.Any]:
+    key = _parse_key(data, kind)
+    with _PARSE_LOCK:
+        entry = _PARSE_CACHE.get(key)
+        if entry is not None:
+            _PARSE_CACHE.move_to_end(key)
+            return entry
+    
+    entry = _parse_fresh(data, kind)
+    
+    size = CONF['convert']['parse']['cache']['size']
+    with _PARSE_LOCK:
+        if size > 0:
+            _PARSE_CACHE[key] = entry
+            while len(_PARSE_CACHE) > size:
+                _PARSE_CACHE.popitem(last=False)
+    
+    return entry
+
+def _parse_fresh(data: t.Any, kind: str) -> tuple[bool, t.Any]:
+    try:
+        return (True, _PARSERS[kind](data))
+    except Exception:
+        return (False, None)
+
+def Convert_as_parsed(data: t.Any, kind: t.Literal['json', 'yaml']) -> tuple[bool, t.Any]:
+    if not isinstance(data, (str, bytes)):
+        return _parse_fresh(data, kind)
+    
+    return _parse_entry(data, kind)
+
+def Convert_try_parse(data: t.Any, kind: t.Literal['json', 'yaml']) -> tuple[bool, t.Any]:
+    if not isinstance(data, (str, bytes)):
+        return _parse_fresh(data, kind)
+    
+    with _PARSE_LOCK:
+        entry = _PARSE_CACHE.pop(_parse_key(data, kind), None)
+    
+    return _parse_fresh(data, kind) if entry is None else entry
+### END: Parse
+
 ### BEGIN: Json
 def Convert_from_json(data: str, **kwargs)-> dict|list:
-    import json
-    return json.loads(data, **kwargs)
+    if Validate_filled(kwargs):
+        import json
+        return json.loads(data, **kwargs)
+    
+    ok, ret = Convert_try_parse(data, 'json')
+    return ret if ok else _parse_json(data)
+
+def Convert_try_from_json(data: str, **kwargs) -> tuple[bool, t.Any]:
+    if Validate_filled(kwargs):
+        try:
+            return (True, Convert_from_json(data, **kwargs))
+        except Exception:
+            return (False, None)
+    
+    return Convert_try_parse(data, 'json')
 
 def Convert_to_json(
     data: t.Union[t.Sequence[t.Any], t.Mapping[t.Any, t.Any]], 
@@ -677,15 +991,19 @@ def Convert_to_json(
 
 ### BEGIN: Yaml
 def Convert_from_yaml(data: str)-> dict|list:
-    import yaml
-    return yaml.unsafe_load(data)
+    ok, ret = Convert_try_parse(data, 'yaml')
+    return ret if ok else _parse_yaml(data)
+
+def Convert_try_from_yaml(data: str) -> tuple[bool, t.Any]:
+    return Convert_try_parse(data, 'yaml')
 
 def Convert_to_yaml(
     data: t.Union[t.Sequence[t.Any], t.Mapping[t.Any, t.Any]], 
     **kwargs,
 )-> str:
-    import yaml
-    return yaml.dump(data, **kwargs)
+    handlers = _backends_handlers()
+    kwargs.setdefault('Dumper', handlers['yaml_dumper'])
+    return handlers['yaml'].dump(data, **kwargs)
 ### END: Yaml
 
 ### BEGIN: Lua
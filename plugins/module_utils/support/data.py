@@ -1,6 +1,6 @@
 ### BEGIN: Imports
 from ansible_collections.aybarsm.utils.plugins.module_utils.support.definitions import (
-    t, functools, 
+    t, functools, re, 
     T, ENUMERATABLE, Sentinel, 
     pydash, 
 )
@@ -9,10 +9,10 @@ from ansible_collections.aybarsm.utils.plugins.module_utils.support.definitions
 from ansible_collections.aybarsm.utils.plugins.module_utils.support.convert import (
 	Convert_as_copied, Convert_as_hash, Convert_from_mapping_to_callable,
 	Convert_to_iterable, Convert_to_pydash, Convert_to_safe_json, 
-    Convert_to_default, 
+    Convert_to_default, Convert_as_structural_hash, Convert_as_structural_key, 
 )
 from ansible_collections.aybarsm.utils.plugins.module_utils.support.str import (
-	Str_after_last, Str_before_last, Str_wrap,
+	Str_wrap,
 )
 from ansible_collections.aybarsm.utils.plugins.module_utils.support.utils import (
 	Utils_call,
@@ -22,7 +22,7 @@ from ansible_collections.aybarsm.utils.plugins.module_utils.support.validate imp
 	Validate_is_ansible_omitted, Validate_is_falsy, Validate_is_iterable,
 	Validate_is_iterable_of_mappings, Validate_is_iterable_of_not_mappings, Validate_is_mapping,
 	Validate_is_sequence, Validate_is_string, Validate_require_mutable_mappings,
-	Validate_str_contains, Validate_str_is_int,
+	Validate_str_contains,
 )
 ### END: ImportManager
 
@@ -101,16 +101,269 @@ def Data_filter(data, predicate, default: t.Any = [], **kwargs) -> t.Any:
 
 @functools.wraps(pydash().duplicates)
 def Data_duplicates(data, iteratee = None, default: t.Any = []) -> t.Any:
-    return Convert_to_default(pydash().duplicates(data, iteratee), [], default)
+    computed = data
+    if iteratee:
+        callback = pydash().iteratee(iteratee)
+        computed = [callback(item) for item in data]
+
+    ret = []
+    seen = set()
+    found = set()
+    try:
+        for item, value in zip(data, computed):
+            hash_ = Convert_as_structural_hash(value)
+            if hash_ not in seen:
+                seen.add(hash_)
+                continue
+
+            hash_ = Convert_as_structural_hash(item) if iteratee else hash_
+            if hash_ not in found:
+                found.add(hash_)
+                ret.append(item)
+    except TypeError:
+        ret = pydash().duplicates(data, iteratee)
+
+    return Convert_to_default(ret, [], default)
 ### END: Locate
 
+### BEGIN: Paths
+_PATH_SLICE = re.compile(r'^\[(-?\d*):(-?\d*)(?::(-?\d*))?\]$')
+
+class _PathPattern(tuple):
+    pass
+
+def _path_segment(segment: str) -> tuple:
+    try:
+        return (segment, int(segment))
+    except ValueError:
+        return (segment, None)
+
+@functools.lru_cache(maxsize=2048, typed=True)
+def _path_compile(key: t.Hashable) -> t.Any:
+    if isinstance(key, str):
+        segments = key.split('.') if '.' in key else [key]
+        
+        if key == '*' or '.*' in key or '*.' in key or ('[' in key and any(_PATH_SLICE.match(segment) for segment in segments)):
+            return _path_compile_pattern(key)
+        elif '[' in key or '\\' in key:
+            return None
+        
+        # Segments keep the int form beside the key, mirroring the pydash lookup fallbacks
+        return tuple(_path_segment(segment) for segment in segments)
+    elif isinstance(key, int):
+        return ((key, key), )
+    
+    return None
+
+def _path_compile_pattern(key: str) -> _PathPattern:
+    ret = []
+    for segment in key.strip('.').split('.'):
+        match = _PATH_SLICE.match(segment)
+        
+        if segment in ('*', '**'):
+            ret.append((segment, None))
+        elif match:
+            ret.append(('slice', slice(*[int(part) if Validate_filled(part) else None for part in match.groups()])))
+        else:
+            ret.append(('key', _path_segment(segment)))
+    
+    return _PathPattern(ret)
+
+def _path_resolve(key: t.Any) -> t.Any:
+    try:
+        return _path_compile(key)
+    except TypeError:
+        return _path_compile_pattern(str(key)) if str(key) == '*' or Validate_str_contains(str(key), '.*', '*.') else None
+
+def _path_children(data) -> list:
+    if isinstance(data, t.Mapping):
+        return list(data.values())
+    elif isinstance(data, (list, tuple)):
+        return list(data)
+    
+    return []
+
+def _path_walk(data, pattern: _PathPattern) -> t.Iterator[t.Any]:
+    # Depth first over references, children are pushed reversed so matches come out in document order
+    stack = [(data, 0)]
+    seen = set()
+    size = len(pattern)
+    
+    while stack:
+        node, pos = stack.pop()
+        if pos == size:
+            yield node
+            continue
+        
+        kind, arg = pattern[pos]
+        if kind == 'key':
+            value = _path_get(node, (arg, ), Sentinel.raw)
+            if value is not Sentinel.raw:
+                stack.append((value, pos + 1))
+        elif kind == '*':
+            stack.extend((child, pos + 1) for child in reversed(_path_children(node)))
+        elif kind == 'slice':
+            if isinstance(node, (list, tuple)):
+                stack.extend((child, pos + 1) for child in reversed(node[arg]))
+        elif kind == '**':
+            if (id(node), pos) in seen:
+                continue
+            
+            seen.add((id(node), pos))
+            stack.extend((child, pos) for child in reversed(_path_children(node)))
+            stack.append((node, pos + 1))
+
+def _path_get(data, path: tuple, default: t.Any = None) -> t.Any:
+    for pos, (key, index) in enumerate(path):
+        if isinstance(data, dict):
+            value = data.get(key, Sentinel.raw)
+            if value is Sentinel.raw and index is not None:
+                value = data.get(index, Sentinel.raw)
+        elif isinstance(data, list) or type(data) is tuple:
+            value = Sentinel.raw
+            if index is not None:
+                try:
+                    value = data[index]
+                except IndexError:
+                    pass
+        else:
+            return pydash().get(data, [segment[0] for segment in path[pos:]], default)
+        
+        if value is Sentinel.raw:
+            return default
+        
+        data = value
+    
+    return data
+
+def _path_has(data, path: tuple) -> bool:
+    for pos, (key, index) in enumerate(path):
+        if not isinstance(data, dict) and not isinstance(data, list) and type(data) is not tuple:
+            return pydash().has(data, [segment[0] for segment in path[pos:]])
+        
+        data = _path_get(data, ((key, index), ), Sentinel.raw)
+        if data is Sentinel.raw:
+            return False
+    
+    return True
+
+def _path_set(data, key: t.Any, path: t.Optional[tuple], value: t.Any) -> t.Any:
+    # Only existing containers are walked here, anything pydash would create or coerce is left to it
+    target = data
+    for pos, (segment, index) in enumerate(path or ()):
+        last = pos == len(path) - 1
+        
+        if isinstance(target, dict) and segment in target:
+            if last:
+                target[segment] = value
+                return data
+            
+            target = target[segment]
+        elif isinstance(target, dict) and last:
+            target[segment] = value
+            return data
+        elif isinstance(target, list) and index is not None and 0 <= index < len(target):
+            if last:
+                target[index] = value
+                return data
+            
+            target = target[index]
+        else:
+            break
+    
+    return pydash().set_(data, key, value)
+
+def _path_own(data, path: tuple, owned: set) -> None:
+    # Replaces the shared containers leading to the last segment with shallow copies, so a following
+    # write or removal only touches containers in the owned set
+    for key, index in path[:-1]:
+        if isinstance(data, dict):
+            key = key if key in data else index
+            if key is None or key not in data:
+                return
+        elif isinstance(data, list) and index is not None and -len(data) <= index < len(data):
+            key = index
+        else:
+            return
+        
+        child = data[key]
+        if id(child) not in owned:
+            if isinstance(child, dict):
+                child = dict(child)
+            elif isinstance(child, list):
+                child = list(child)
+            else:
+                return
+            
+            data[key] = child
+            owned.add(id(child))
+        
+        data = child
+
+def _path_unset(data, path: tuple) -> None:
+    parent = _path_get(data, path[:-1], Sentinel.raw)
+    key, index = path[-1]
+    
+    if isinstance(parent, dict):
+        parent.pop(key if key in parent else index, None)
+    elif isinstance(parent, list) and index is not None and -len(parent) <= index < len(parent):
+        parent.pop(index)
+
+class DataAccessor:
+    def __init__(self, key: t.Any):
+        self.key: t.Any = key
+        self.path: t.Any = _path_resolve(key)
+    
+    def __call__(self, data, default = None) -> t.Any:
+        return self.get(data, default)
+    
+    def get(self, data, default = None) -> t.Any:
+        if self.path is None or isinstance(self.path, _PathPattern):
+            return Data_get(data, self.key, default)
+        
+        return _path_get(data, self.path, default)
+    
+    def has(self, data) -> bool:
+        if self.path is None or isinstance(self.path, _PathPattern):
+            return pydash().has(data, self.key)
+        
+        return _path_has(data, self.path)
+    
+    def set(self, data, value: t.Any) -> t.Any:
+        return _path_set(data, self.key, None if isinstance(self.path, _PathPattern) else self.path, value)
+
+def Data_accessor(key: t.Any) -> DataAccessor:
+    return DataAccessor(key)
+### END: Paths
+
 @functools.wraps(pydash().get)
-def Data_get(data, key, default = None) -> t.Any:
-    if not str(key) == '*' and not Validate_str_contains(str(key), '.*', '*.'):
+def Data_get(data, key, default = None, copy: bool = False, strict: bool = False) -> t.Any:
+    path = _path_resolve(key)
+    if path is None:
         return pydash().get(data, key, default)
+    elif not isinstance(path, _PathPattern):
+        return _path_get(data, path, default)
+    elif not strict:
+        if not _path_is_wildcard(key):
+            return pydash().get(data, key, default)
+        
+        ret = _path_get_plucked(data, key, default)
+        return Convert_as_copied(ret) if copy and ret is not default else ret
+    
+    ret = list(_path_walk(data, path))
+    if not ret:
+        return default
     
+    return Convert_as_copied(ret) if copy else ret
+
+def _path_is_wildcard(key: t.Any) -> bool:
+    key = str(key)
+    return key == '*' or '.*' in key or '*.' in key
+
+def _path_get_plucked(data, key, default: t.Any = None) -> t.Any:
+    # Default wildcard semantics: keys pluck through lists of mappings and empty values are flattened away
     skip_ = []
-    ret = Convert_as_copied(data)
+    ret = data
     segments = str(key).strip('.').split('.')
     for idx_, segment in enumerate(segments):
         if idx_ in skip_:
@@ -124,11 +377,11 @@ def Data_get(data, key, default = None) -> t.Any:
             ret = Data_pluck(ret, segments[idx_ + 1])
             skip_.append(idx_ + 1)
         elif segment == '*' and Validate_is_mapping(ret):
-            ret = list(dict(ret).values())
+            ret = list(ret.values())
         elif segment != '*' and Validate_is_iterable_of_mappings(ret):
             ret = Data_pluck(ret, segment)
         elif segment != '*' and Validate_is_mapping(ret):
-            ret = Convert_as_copied(pydash().get(ret, segment))       
+            ret = pydash().get(ret, segment)
         elif segment == '*':
             ret = Data_flatten(ret, levels=1)
         
@@ -138,13 +391,31 @@ def Data_get(data, key, default = None) -> t.Any:
 
     return ret
 
+def Data_get_iter(data, key) -> t.Iterator[t.Any]:
+    # Wildcards are walked with the strict semantics of Data_get(strict=True)
+    path = _path_resolve(key)
+    if isinstance(path, _PathPattern):
+        yield from _path_walk(data, path)
+    elif path is not None:
+        value = _path_get(data, path, Sentinel.raw)
+        if value is not Sentinel.raw:
+            yield value
+    elif pydash().has(data, key):
+        yield pydash().get(data, key)
+
 @functools.wraps(pydash().set_)
 def Data_set(data, key, value: t.Any) -> t.Any:
-    return pydash().set_(data, key, value)
+    path = _path_resolve(key)
+    
+    return _path_set(data, key, None if isinstance(path, _PathPattern) else path, value)
 
 @functools.wraps(pydash().has)
 def Data_has(data, key) -> bool:
-    return pydash().has(data, key)
+    path = _path_resolve(key)
+    if path is None or isinstance(path, _PathPattern):
+        return pydash().has(data, key)
+    
+    return _path_has(data, path)
 
 @functools.wraps(pydash().unset)
 def Data_unset(data, *args) -> t.Any:
@@ -196,19 +467,67 @@ def Data_walk(data, iteratee):
 def Data_walk_values_deep(data, iteratee):
     return pydash().map_values_deep(data, iteratee)
 
+def _identity(value: t.Any) -> t.Any:
+    return value
+
+def _set_operands(others: tuple) -> bool:
+    return Validate_filled(others) and not callable(others[-1]) and others[-1] is not None
+
+def _set_difference(data, others: tuple, key: t.Callable) -> list:
+    excluded = set()
+    for other in others:
+        excluded.update(key(item) for item in other)
+
+    return [item for item in data if key(item) not in excluded]
+
+def _set_intersection(data, others: tuple, key: t.Callable) -> list:
+    included = [set(key(item) for item in other) for other in others]
+    included.sort(key=len)
+
+    ret = []
+    seen = set()
+    for item in data:
+        hash_ = key(item)
+        if hash_ in seen:
+            continue
+
+        seen.add(hash_)
+        if all(hash_ in other for other in included):
+            ret.append(item)
+
+    return ret
+
 @functools.wraps(pydash().difference)
 def Data_difference(data, *others, **kwargs)-> t.List[t.Any]:
-    if Validate_blank(kwargs):
-        return pydash().difference_with(data, *others)
-    else:
+    if Validate_filled(kwargs):
         return pydash().difference_by(data, *others, **kwargs)
+    elif not _set_operands(others):
+        return pydash().difference_with(data, *others)
+
+    # Plain hashing first, canonical keys once an unhashable value shows up, and the comparator walk
+    # only for values that cannot be keyed at all.
+    for key in (_identity, Convert_as_structural_key):
+        try:
+            return _set_difference(data, others, key)
+        except TypeError:
+            continue
+
+    return pydash().difference_with(data, *others)
 
 @functools.wraps(pydash().intersection)
 def Data_intersection(data, *others, **kwargs)-> t.List[t.Any]:
-    if Validate_blank(kwargs):
-        return pydash().intersection_with(data, *others)
-    else:
+    if Validate_filled(kwargs):
         return pydash().intersection_by(data, *others, **kwargs)
+    elif not _set_operands(others):
+        return pydash().intersection_with(data, *others)
+
+    for key in (_identity, Convert_as_structural_key):
+        try:
+            return _set_intersection(data, others, key)
+        except TypeError:
+            continue
+
+    return pydash().intersection_with(data, *others)
 
 def _append_or_prepend(
     data, 
@@ -253,70 +572,87 @@ def Data_prepend(data, key: int | str, *args: t.Any, **kwargs) -> t.Any:
     kwargs['_prepend'] = True
     return _append_or_prepend(data, key, *args, **kwargs)
 
-def Data_dot(data: t.Union[t.Sequence[t.Any], t.Mapping[t.Any, t.Any]], prepend='', **kwargs)-> dict:
-    is_main = Validate_blank(prepend)
-    is_main_mapping = is_main and Validate_is_mapping(data)
-    if is_main_mapping:
-        data = Data_undot(data) #type: ignore
-
-    ret = {}
-    if Validate_is_sequence(data):
-        for key, value in enumerate(data):
-            new_key = f"{prepend}{str(key)}"
-            if value and (Validate_is_mapping(value) or Validate_is_sequence(value)):
-                ret.update(Data_dot(value, new_key + '.'))
-            else:
-                ret[new_key] = value
-    elif Validate_is_mapping(data):
-        for key, value in data.items(): #type: ignore
-            new_key = f"{prepend}{key}"
-            if value and (Validate_is_mapping(value) or Validate_is_sequence(value)):
-                ret.update(Data_dot(value, new_key + '.'))
+def Data_dot_iter(data: t.Union[t.Sequence[t.Any], t.Mapping[t.Any, t.Any]], prepend: str = '') -> t.Iterator[tuple[str, t.Any]]:
+    # Explicit stack in place of recursion, children are pushed reversed to keep the document order
+    stack = [(prepend, data, False)]
+    while stack:
+        key, value, is_leaf = stack.pop()
+        if is_leaf:
+            yield key, value
+            continue
+        
+        if Validate_is_sequence(value):
+            items = enumerate(value)
+        elif Validate_is_mapping(value):
+            items = value.items()
+        else:
+            continue
+        
+        children = []
+        for child_key, child in items:
+            child_key = f'{key}{child_key}'
+            if child and (Validate_is_mapping(child) or Validate_is_sequence(child)):
+                children.append((f'{child_key}.', child, False))
             else:
-                ret[new_key] = value
+                children.append((child_key, child, True))
+        
+        stack.extend(reversed(children))
+
+def Data_dot(data: t.Union[t.Sequence[t.Any], t.Mapping[t.Any, t.Any]], prepend='', **kwargs)-> dict:
+    ret = dict(Data_dot_iter(data, prepend))
     
-    if is_main_mapping:
-        sorted = kwargs.pop('sorted', False)
-        if sorted:
-            asc = kwargs.pop('asc', True)
-            ret = dict(sorted(ret.items()) if asc else reversed(sorted(ret.items())))
+    if Validate_blank(prepend) and Validate_is_mapping(data) and kwargs.pop('sorted', False):
+        asc = kwargs.pop('asc', True)
+        ret = dict(sorted(ret.items()) if asc else reversed(sorted(ret.items())))
     
     return ret
 
+class _UndotBranch(dict):
+    # Set when a dotted key ends in an index below this branch, only those branches are rebuilt as lists
+    is_sequence: bool = False
+
+def _undot_branch(node: _UndotBranch, path: tuple) -> _UndotBranch:
+    # Later keys win, a branch replaces a leaf on the way down
+    for segment in path:
+        child = node.get(segment)
+        if not isinstance(child, _UndotBranch):
+            child = node[segment] = _UndotBranch()
+        node = child
+    
+    return node
+
+def _undot_insert(node: _UndotBranch, data: t.Mapping) -> None:
+    for key, value in data.items():
+        path = tuple(key.split('.')) if isinstance(key, str) and '.' in key else (key, )
+        
+        if value and (isinstance(value, dict) or (not isinstance(value, (str, int, float, list)) and Validate_is_mapping(value))):
+            _undot_insert(_undot_branch(node, path), value)
+        else:
+            parent = _undot_branch(node, path[:-1])
+            parent[path[-1]] = value
+            
+            if len(path) > 1 and isinstance(path[-1], str) and path[-1].isascii() and path[-1].isdigit():
+                parent.is_sequence = True
+
+def _undot_resolve(node: t.Any) -> t.Any:
+    if not isinstance(node, _UndotBranch):
+        return node
+    
+    # Indexed branches keyed only by digits become lists ordered by index, sparse indexes are compacted
+    if node.is_sequence and all(isinstance(key, str) and key.isascii() and key.isdigit() for key in node):
+        return [_undot_resolve(node[key]) for key in sorted(node, key=int)]
+    
+    return {key: (_undot_resolve(value) if isinstance(value, _UndotBranch) else value) for key, value in node.items()}
+
 def Data_undot(data: t.Mapping)-> dict:
-    import re
     data = dict(data)
     if Validate_blank(data):
         return data
     
-    done = []
-    ret = {}
-    for key, value in data.items():
-        if key in done:
-            continue
-        
-        done_iter = [key]
-        if Validate_is_mapping(value):
-            Data_set(ret, key, Data_undot(value))
-        elif '.' not in str(key):
-            ret[key] = value
-        elif Validate_str_is_int(Str_after_last(key, '.')):
-            primary = Str_before_last(key, '.')
-            pattern = '^' + re.escape(primary) + '\\.(\\d+)$'
-            pattern = re.compile(pattern)
-            seq_keys = [seq_key for seq_key in data.keys() if seq_key not in done and pattern.match(seq_key)]
-            seq_keys.sort()
-            seq = []
-            for seq_key in seq_keys:
-                seq.append(data[seq_key])
-            done_iter = seq_keys.copy()
-            Data_set(ret, primary, seq.copy())
-        else:
-            Data_set(ret, key, value)
-        
-        done.extend(done_iter)
+    root = _UndotBranch()
+    _undot_insert(root, data)
     
-    return ret
+    return {key: _undot_resolve(value) for key, value in root.items()}
 
 def Data_sort_keys_char_count(
     data: t.Iterable[t.Any],
@@ -463,6 +799,28 @@ def Data_first_filled(*args: t.Any, default: t.Any = None)-> t.Any:
     
     return default
 
+def _projection_compile(keys: t.Sequence[t.Any], no_dot: bool) -> list[tuple]:
+    ret = []
+    for key in keys:
+        path = None if no_dot else _path_resolve(key)
+        
+        if no_dot or (path is not None and len(path) == 1 and path[0][1] is None and not isinstance(path, _PathPattern)):
+            ret.append((key, None, 'flat'))
+        elif path is None or isinstance(path, _PathPattern):
+            ret.append((key, None, 'generic'))
+        else:
+            ret.append((key, path, 'path'))
+    
+    return ret
+
+def _projection_get(item, key: t.Any, path: t.Optional[tuple], kind: str) -> t.Any:
+    if kind == 'flat' and isinstance(item, t.Mapping):
+        return item[key] if key in item else Sentinel.raw
+    elif kind == 'generic':
+        return Data_get(item, key) if Data_has(item, key) else Sentinel.raw
+    
+    return _path_get(item, path or _path_resolve(key), Sentinel.raw)
+
 def Data_only_with(
     data: t.Iterable[t.Any],
     *args: str,
@@ -472,6 +830,7 @@ def Data_only_with(
     is_meta_fix = kwargs.pop('meta_fix', False)
     is_no_dot = kwargs.pop('no_dot', False)
     is_filled = kwargs.pop('filled', False)
+    is_copy = kwargs.pop('copy', False)
 
     default_missing = kwargs.pop('default_missing', Sentinel.hash)
     default_blank = kwargs.pop('default_blank', Sentinel.hash)
@@ -479,27 +838,35 @@ def Data_only_with(
     is_mapping = Validate_is_mapping(data)
     data = Convert_to_pydash(data)
     
+    # Keys pydash has to resolve may write through shared containers, so their plans keep copying
+    plan = _projection_compile(args, is_no_dot)
+    copier = Convert_as_copied if is_copy or any(kind == 'generic' for _, _, kind in plan) else _identity
+    flat_keys = [key for key, _, kind in plan if kind == 'flat']
+    is_flat = len(flat_keys) == len(plan) and not (is_meta or is_filled or is_copy or default_missing != Sentinel.hash)
+    
     ret = []
     for item in Convert_to_iterable(data):
-        keys = Convert_as_copied(list(args))
+        if is_flat and isinstance(item, dict):
+            ret.append({key: item[key] for key in flat_keys if key in item})
+            continue
         
-        meta_keys = [meta_key for meta_key in item.keys() if str(meta_key).startswith('_')] if is_meta else []
-        if Validate_filled(meta_keys):
-            keys.extend(meta_keys)
+        entries = plan
+        if is_meta:
+            entries = plan + [(key, None, 'flat') for key in item.keys() if str(key).startswith('_')]
 
         new_item = {}
-        for key in keys:
-            key_exists = (is_no_dot and key in item) or (not is_no_dot and Data_has(item, key))
+        owned = {id(new_item)}
+        for key, path, kind in entries:
+            found = _projection_get(item, key, path, kind)
             
-            new_value = item.get(key) if is_no_dot else Data_get(item, key)
-            if not key_exists:
+            new_value = found
+            if found is Sentinel.raw:
                 if default_missing != Sentinel.hash:
                     new_value = default_missing
                 else:
                     continue
             
-            is_value_filled = not is_filled or ((is_no_dot and Validate_filled(item[key])) or (not is_no_dot and Validate_filled(Data_get(item, key))))
-            if not is_value_filled:
+            if is_filled and not Validate_filled(Data_get(item, key) if kind == 'generic' else (None if found is Sentinel.raw else found)):
                 if default_blank != Sentinel.hash:
                     new_value = default_blank
                 else:
@@ -508,15 +875,48 @@ def Data_only_with(
             is_key_meta = is_meta and str(key).startswith('_')
             new_key = str(key).lstrip('_') if is_key_meta and is_meta_fix else key
             
-            if is_no_dot:
-                new_item[new_key] = Convert_as_copied(new_value)
+            if kind == 'flat':
+                new_item[new_key] = copier(new_value)
             else:
-                Data_set(new_item, new_key, Convert_as_copied(new_value))
+                new_path = _path_resolve(new_key)
+                if new_path is not None and not isinstance(new_path, _PathPattern):
+                    _path_own(new_item, new_path, owned)
+                
+                Data_set(new_item, new_key, copier(new_value))
         
         ret.append(new_item)
     
     return ret[0] if is_mapping else ret
 
+def _projection_except_copied(item, keys: t.Sequence[t.Any], is_meta: bool, is_omitted: bool, is_no_dot: bool, is_blank: bool) -> t.Any:
+    keys = list(keys)
+    
+    exclude_keys = [exc_key for exc_key in item.keys() if str(exc_key).startswith('_')] if is_meta else []
+    if Validate_filled(exclude_keys):
+        keys.extend(exclude_keys)
+    
+    if is_omitted or is_blank:
+        exclude_value_keys = [exc_key for exc_key, exc_value in item.items() if (is_omitted and Validate_is_ansible_omitted(exc_value)) or (is_blank and Validate_blank(exc_value))]
+    else:
+        exclude_value_keys = []
+    
+    if Validate_filled(exclude_value_keys):
+        keys.extend(exclude_value_keys)
+
+    new_item = Convert_as_copied(item)
+    
+    for key in keys:
+        key_exists = (is_no_dot and key in item) or (not is_no_dot and Data_has(item, key))
+        if not key_exists:
+            continue
+        
+        if is_no_dot:
+            del new_item[key]
+        else:
+            Data_unset(new_item, key)
+    
+    return new_item
+
 def Data_all_except(
     data: t.Iterable[t.Any],
     *args: str,
@@ -526,62 +926,118 @@ def Data_all_except(
     is_omitted = kwargs.pop('omitted', False)
     is_no_dot = kwargs.pop('no_dot', False)
     is_blank = kwargs.pop('blank', False)
+    is_copy = kwargs.pop('copy', False)
 
     is_mapping = Validate_is_mapping(data)
     data = Convert_to_pydash(data)
+    
+    plan = _projection_compile(args, is_no_dot)
+    is_generic = is_copy or any(kind == 'generic' for _, _, kind in plan)
+    flat_keys = set(key for key, _, kind in plan if kind == 'flat')
+    is_flat = len(flat_keys) == len(plan) and not (is_meta or is_omitted or is_blank)
     ret = []
 
     for item in Convert_to_iterable(data):
-        keys = list(args)
-        
-        exclude_keys = [exc_key for exc_key in item.keys() if str(exc_key).startswith('_')] if is_meta else []
-        if Validate_filled(exclude_keys):
-            keys.extend(exclude_keys)
-        
-        if is_omitted or is_blank:
-            exclude_value_keys = [exc_key for exc_key, exc_value in item.items() if (is_omitted and Validate_is_ansible_omitted(exc_value)) or (is_blank and Validate_blank(exc_value))]
-        else:
-            exclude_value_keys = []
+        if not isinstance(item, dict) or is_generic:
+            ret.append(_projection_except_copied(item, args, is_meta, is_omitted, is_no_dot, is_blank))
+            continue
+        elif is_flat:
+            ret.append({key: value for key, value in item.items() if key not in flat_keys})
+            continue
         
-        if Validate_filled(exclude_value_keys):
-            keys.extend(exclude_value_keys)
-
-        new_item = Convert_as_copied(item)
+        entries = plan
+        if is_meta or is_omitted or is_blank:
+            entries = plan + [
+                (key, None, 'flat') for key, value in item.items() 
+                if (is_meta and str(key).startswith('_')) or (is_omitted and Validate_is_ansible_omitted(value)) or (is_blank and Validate_blank(value))
+            ]
         
-        for key in keys:
-            key_exists = (is_no_dot and key in item) or (not is_no_dot and Data_has(item, key))
-            if not key_exists:
-                continue
-            
-            if is_no_dot:
-                del new_item[key]
+        new_item = dict(item)
+        owned = {id(new_item)}
+        for key, path, kind in entries:
+            if kind == 'flat':
+                new_item.pop(key, None)
             else:
-                Data_unset(new_item, key)
+                _path_own(new_item, path, owned)
+                _path_unset(new_item, path)
         
         ret.append(new_item)
     
     return ret[0] if is_mapping else ret
 
+def Data_flatten_iter(data, levels=None, skip_nulls=True) -> t.Iterator[t.Any]:
+    # One iterator per open sequence, the stack depth doubles as the level count
+    levels = None if levels is None else int(levels)
+    stack = [iter(data)]
+    
+    while stack:
+        for element in stack[-1]:
+            if skip_nulls and (element is None or (isinstance(element, str) and (element == 'None' or element == 'null'))):
+                continue
+            elif (levels is None or len(stack) <= levels) and (isinstance(element, list) or Validate_is_sequence(element)):
+                stack.append(iter(element))
+                break
+            
+            yield element
+        else:
+            stack.pop()
+
 def Data_flatten(data, levels=None, skip_nulls=True):
-    ret = []
-    for element in data:
-        if skip_nulls and element in (None, 'None', 'null'):
-            continue
-        elif Validate_is_sequence(element):
-            if levels is None:
-                ret.extend(Data_flatten(element, skip_nulls=skip_nulls))
-            elif levels >= 1:
-                ret.extend(Data_flatten(element, levels=(int(levels) - 1), skip_nulls=skip_nulls))
-            else:
-                ret.append(element)
+    return list(Data_flatten_iter(data, levels, skip_nulls))
+
+def _merge_lists(items: list, list_merge: str) -> t.Any:
+    # Right fold of the pairwise list merge, the last list is the accumulated side
+    ret = items[-1]
+    if list_merge == 'replace':
+        return ret
+    
+    for item in reversed(items[:-1]):
+        if list_merge == 'append_rp':
+            ret = [z for z in item if z not in ret] + ret
+        elif list_merge == 'prepend_rp':
+            ret = ret + [z for z in item if z not in ret]
         else:
-            ret.append(element)
+            ret = item
+    
+    return ret
 
+def _merge_nway(items: list, recursive: bool, list_merge: str) -> t.Any:
+    # Equivalent to folding the pairwise merge from the right, all layers are walked at once and
+    # subtrees present in a single layer are shared by reference
+    items = [item for item in items if item]
+    if not items:
+        return {}
+    elif len(items) == 1:
+        return items[0]
+    
+    grouped = {}
+    for item in items:
+        for key, value in item.items():
+            grouped.setdefault(key, []).append(value)
+    
+    ret = {}
+    for key, values in grouped.items():
+        last = values[-1]
+        
+        if len(values) == 1:
+            ret[key] = last
+        elif isinstance(last, t.MutableMapping):
+            ret[key] = _merge_nway([value for value in values if isinstance(value, t.MutableMapping)], recursive, list_merge) if recursive else last
+        elif isinstance(last, t.MutableSequence):
+            ret[key] = _merge_lists([value for value in values if isinstance(value, t.MutableSequence)], list_merge)
+        else:
+            ret[key] = last
+    
     return ret
 
 def Data_merge_hash(x, y, recursive=True, list_merge='replace'):
     Validate_require_mutable_mappings(x, y)
     
+    # The equality shortcut below changes append / prepend results, so only those keep the pairwise walk
+    if list_merge not in ('append', 'prepend'):
+        ret = _merge_nway([x, y], recursive, list_merge)
+        return dict(ret) if ret is x or ret is y else ret
+    
     if x == {} or x == y:
         return y.copy()
     if y == {}:
@@ -633,13 +1089,20 @@ def Data_combine(*args, **kwargs):
     if reverse:
         args.reverse()
 
-    dicts = Data_flatten(args, levels=1)
+    dicts = list(Data_flatten_iter(args, levels=1))
 
     if Validate_blank(dicts):
         return {}
 
     if len(dicts) == 1:
         return dicts[0]
+    
+    if list_merge not in ('append', 'prepend'):
+        for dictionary in dicts[:-1]:
+            Validate_require_mutable_mappings(dictionary, dicts[-1])
+        
+        result = _merge_nway(dicts, recursive, list_merge)
+        return dict(result) if any(result is dictionary for dictionary in dicts) else result
 
     dicts = reversed(dicts)
     result = next(dicts)
@@ -648,6 +1111,44 @@ def Data_combine(*args, **kwargs):
 
     return result
 
+_PATTERN_UNSHAREABLE = re.compile(r'\\[1-9]|\(\?P[<=]|\(\?\(|\(\?[aiLmsux-]')
+
+class DataPatternMatcher:
+    def __init__(self, patterns: t.Sequence[t.Optional[str]], prepare: bool = False):
+        self.rules: list[tuple[int, str]] = [
+            (idx, Str_wrap(pattern, '^', '$') if prepare else pattern) for idx, pattern in enumerate(patterns)
+            if Validate_is_string(pattern) and Validate_filled(pattern)
+        ]
+        self.compiled: list[tuple[int, re.Pattern]] = [(idx, re.compile(pattern)) for idx, pattern in self.rules]
+        self.combined: t.Optional[re.Pattern] = self.compile_combined()
+        self.groups: list[int] = [self.combined.groupindex[f'_{pos}'] for pos in range(len(self.rules))] if self.combined else []
+    
+    def compile_combined(self) -> t.Optional[re.Pattern]:
+        # Every rule becomes an optional lookahead at the start, so one anchored match reports all of
+        # them. Backreferences, named groups and inline flags do not survive renumbering or nesting.
+        if len(self.rules) < 2 or any(_PATTERN_UNSHAREABLE.search(pattern) for _, pattern in self.rules):
+            return None
+        
+        try:
+            return re.compile(''.join(f'(?:(?=(?P<_{pos}>{pattern})))?' for pos, (_, pattern) in enumerate(self.rules)))
+        except (re.error, RecursionError, OverflowError):
+            return None
+    
+    def match(self, data: str) -> list[int]:
+        if self.combined is None:
+            return [idx for idx, pattern in self.compiled if pattern.match(data)]
+        
+        groups = self.combined.match(data).group(*self.groups)
+        return [self.rules[pos][0] for pos, group in enumerate(groups) if group is not None]
+
+@functools.lru_cache(maxsize=128)
+def _pattern_matcher(patterns: tuple, prepare: bool) -> DataPatternMatcher:
+    return DataPatternMatcher(patterns, prepare)
+
+def Data_pattern_matcher(patterns: t.Sequence[t.Optional[str]], prepare: bool = False) -> DataPatternMatcher:
+    patterns = tuple(pattern if Validate_is_string(pattern) else None for pattern in patterns)
+    return _pattern_matcher(patterns, prepare == True)
+
 def Data_combine_match(
     data: str,
     items: t.Mapping[str, t.Any] | ENUMERATABLE[t.Mapping[str, t.Any]], 
@@ -655,20 +1156,11 @@ def Data_combine_match(
     *args, 
     **kwargs
 ):
-    import re
     is_prepare = kwargs.pop('prepare', False)
-    ret = []
-
-    for item in Convert_to_iterable(items):
-        pattern = Data_get(item, attribute)
-        if not Validate_is_string(pattern) or Validate_blank(pattern):
-            continue
-            
-        if is_prepare:
-            pattern = Str_wrap(pattern, '^', '$')
-            
-        if re.match(rf"{pattern}", data):
-            ret.append(item)
+    
+    items = Convert_to_iterable(items)
+    matcher = Data_pattern_matcher([Data_get(item, attribute) for item in items], is_prepare)
+    ret = [items[idx] for idx in matcher.match(data)]
     
     if Validate_filled(args):
         ret.extend(list(args))
@@ -692,8 +1184,18 @@ def Data_keys(
     replace = kwargs.pop('replace', {})
     no_dot = kwargs.pop('no_dot', False)
 
+    # Plain dicts only copy the containers along the keys being moved, keys pydash has to resolve
+    # may write anywhere, so they keep the full copy
+    paths = {} if no_dot else {key: _path_resolve(key) for replacement in replace.get('keys', []) if Validate_is_sequence(replacement) for key in replacement[:2]}
+    is_owned = all(path is not None and not isinstance(path, _PathPattern) for path in paths.values())
+
     for item in Convert_to_iterable(data):
-        item_new = Convert_as_copied(item)
+        if is_owned and isinstance(item, dict):
+            item_new = dict(item)
+            owned = {id(item_new)}
+        else:
+            item_new = Convert_as_copied(item)
+            owned = None
     
         for replacement in replace.get('keys', []):
             if not Validate_is_sequence(replacement) or len(replacement) < 2:
@@ -722,12 +1224,18 @@ def Data_keys(
             if no_dot:
                 item_new[key_to] = value_new
             else:
+                if owned is not None:
+                    _path_own(item_new, paths[key_to], owned)
+                
                 Data_set(item_new, key_to, value_new)
 
             if key_exists and not Validate_is_falsy(replace.get('remove_replaced', True)):
                 if no_dot:
                     del item_new[key_from]
                 else:
+                    if owned is not None:
+                        _path_own(item_new, paths[key_from], owned)
+                    
                     Data_unset(item_new, key_from)
             
         ret.append(item_new)
@@ -1,53 +1,69 @@
 ### BEGIN: Imports
 import typing as t
 import re
+import os
+import itertools
 from jinja2.runtime import Context
 from ansible_collections.aybarsm.utils.plugins.module_utils.support.definitions import (
-    t, re, 
+    t, re, dt, 
     CONF, 
 )
 from ansible_collections.aybarsm.utils.plugins.module_utils.support.fluent import Fluent
+from ansible_collections.aybarsm.utils.plugins.module_utils.support._data_query.cache import DataQueryPlanCache
+from ansible_collections.aybarsm.utils.plugins.module_utils.support._data_query.parser import (
+    DataQueryLexer, DataQueryParser, DataQuerySyntaxError,
+)
 ### END: Imports
 ### BEGIN: ImportManager
 from ansible_collections.aybarsm.utils.plugins.module_utils.support.convert import (
-	Convert_from_querystring, Convert_to_data_key, Convert_to_iterable,
-    Convert_to_text, 
+	Convert_as_copied, Convert_from_querystring, Convert_to_data_key,
+	Convert_to_iterable, Convert_to_text,
 )
 from ansible_collections.aybarsm.utils.plugins.module_utils.support.data import (
 	Data_combine, Data_difference, Data_first,
-	Data_flatten, Data_intersection,
+	Data_intersection,
 )
 from ansible_collections.aybarsm.utils.plugins.module_utils.support.str import (
 	Str_chop_both, Str_chop_start,
 )
-from ansible_collections.aybarsm.utils.plugins.module_utils.support.utils import (
-	Utils_product,
-)
 from ansible_collections.aybarsm.utils.plugins.module_utils.support.validate import (
-	Validate_blank, Validate_contains, Validate_filled,
-	Validate_is_enumeratable_of_mappings, Validate_is_int_even, Validate_is_string,
-	Validate_str_wrapped,
+	Validate_blank, Validate_filled, Validate_is_enumeratable_of_mappings,
+	Validate_is_mapping, Validate_is_string, Validate_str_wrapped,
 )
 ### END: ImportManager
 
+@dt.dataclass(frozen=True)
+class DataQueryBinding:
+    kind: t.Literal['positional', 'named']
+    key: int | str
+
+_MISSING = object()
+
 class DataQuery:
     def __init__(
         self,
         context: t.Optional[Context] = None,
-        data: t.Sequence[t.Any] = [],
+        data: t.Iterable[t.Any] = [],
         query: str = '',
         *bindings: t.Any,
         **kwargs: t.Any,
     ):
-        self.cfg: Fluent = Fluent(CONF['data_query'])
+        self.cfg: Fluent = Fluent(Convert_as_copied(CONF['data_query']))
         self.context: t.Optional[Context] = None
         self.data: list[t.Any] = []
+        self.source: t.Any = None
+        self.stream: t.Optional[t.Iterator[t.Any]] = None
+        self.mod_attr: bool = False
+        self.plan_cache_hit: bool = False
+        self.plan_volatile: bool = False
         self.query: str = ''
         self.bindings_positional: list[t.Any] = []
         self.bindings_named: dict[str, t.Any] = {}
         self.operators_and: list[str] = []
         self.operators_or: list[str] = []
         self.tokens: Fluent = Fluent()
+        self.profile: dict[str, t.Any] = {}
+        self.indexes: dict[str, t.Any] = {}
 
         self.set_context(context)
         self.set_data(data)
@@ -68,71 +84,52 @@ class DataQuery:
             self.cfg.get('settings.operators_or', ['or', 'OR', '||']),
         )
     
-    def resolve_tokens(self):
+    def resolve_tokens(self, tree: dict[str, t.Any]) -> None:
         self.tokens = Fluent()
-        master = {'idx': 0, 'next': 1}
-        stack = []
-
-        segments = self.get_query_segments()
-        for idx, segment in enumerate(segments):
-            stack_key = self.tokens.get('_meta.stack.key')
-            if (self.is_token_segment_operator(segment) or segment in ['(', ')']) and self.should_token_batch_finalise():
-                self._token_batch_finalise(stack_key)
-
-            if segment == '(':
-                if idx == 0:
-                    stack = [master]
+        ret = {}
+        ret['0'] = self._resolve_token_group(tree, '0', ret)
+        ret['0']['cond'] = ret['0']['cond'] or 'any'
+        ret['_meta'] = {'data_keys': list(self.tokens.get('_meta.data_keys', []))}
+        
+        self.tokens = Fluent(ret)
+    
+    def _resolve_token_group(self, node: dict[str, t.Any], key: str, masters: t.Optional[dict] = None) -> dict[str, t.Any]:
+        ret = {'cond': node['cond'], 'key': key}
+        tests = []
+        subs = {}
+        
+        # Operands are resolved in query order so positional bindings keep their order
+        for operand in node['operands']:
+            if operand['type'] == 'group':
+                # First level groups sit next to the master group, deeper ones nest under `subs`
+                if masters is not None:
+                    sub_key = str(len(masters) + 1)
+                    masters[sub_key] = self._resolve_token_group(operand, sub_key)
                 else:
-                    if len(stack) == 1 and stack[0]['idx'] == 0:
-                        stack = []
-                        parent = master
-                    else:
-                        parent = stack[-1]
-                    
-                    stack.append({'idx': parent['next'], 'next': 0})
-                    parent['next'] += 1
-            elif segment == ')':
-                stack.pop()
+                    sub_key = str(len(subs))
+                    subs[sub_key] = self._resolve_token_group(operand, f'{key}.subs.{sub_key}')
                 
-                if Validate_blank(stack):
-                    stack.append(master)
-            
-            if segment in ['(', ')']:
-                key_segments = [str(n['idx']) for n in stack]
-                
-                if len(key_segments) > 1:
-                    key_segments = [key_segments[0]] + Data_flatten(Utils_product(['subs'], key_segments[1:]))
-
-                self.tokens.set('_meta.stack.key', '.'.join(key_segments))
-                # self.tokens.set('_meta.stack.key', '_'.join(str(n['idx']) for n in stack))
                 continue
             
-            if self.is_token_segment_operator(segment):
-                if not self.tokens.has(f'{stack_key}.cond'):
-                    self.tokens.set(
-                        f'{stack_key}.cond',
-                        ('all' if self.is_token_segment_operator_and(segment) else 'any')
-                    )
-                    self.tokens.set(
-                        f'{stack_key}.key',
-                        stack_key
-                    )
+            self.tokens.set('_meta.batch', {})
+            try:
+                for term in operand['terms']:
+                    self._resolve_token_segment(term)
                 
-                continue
-
-            self._resolve_token_segment(segment)
-        
-        if not self.tokens.has('0.cond'):
-            self.tokens.set('0.cond', 'any')
-    
-    def _token_batch_finalise(self, stack_key: str) -> None:
-        self.tokens.append(
-            f'{stack_key}.tests',
-            self._resolve_token_test_batch()
-        )
+                tests.append(self._resolve_token_test_batch())
+            except DataQuerySyntaxError:
+                raise
+            except ValueError as e:
+                raise DataQuerySyntaxError(str(e), self.query, operand['pos']) from e
         
         self.tokens.set('_meta.batch', {})
-
+        if tests:
+            ret['tests'] = tests
+        if subs:
+            ret['subs'] = subs
+        
+        return ret
+    
     def _resolve_token_segment(self, segment: str) -> None:
         item = self._resolve_token_segment_item(segment)
         
@@ -158,15 +155,35 @@ class DataQuery:
 
     def _resolve_token_segment_item(self, segment: str) -> t.Any:
         if self.is_token_segment_item_binding_positional(segment):
-            ret = self.bindings_positional[self.cfg.get('b_pos', 0)]
+            ret = DataQueryBinding('positional', self.cfg.get('b_pos', 0))
+            if ret.key >= len(self.bindings_positional):
+                raise ValueError('Invalid number of positional bindings')
+            
             self.cfg.increase('b_pos')
         elif self.is_token_segment_item_binding_named(segment):
-            ret = self.bindings_named[segment.lstrip(':')]
+            ret = DataQueryBinding('named', segment.lstrip(':'))
+            if ret.key not in self.bindings_named:
+                raise ValueError(f'Missing named bindings [{ret.key}]')
         else:
            ret = segment
         
         return ret
     
+    def _resolve_token_binding(self, item: t.Any) -> t.Any:
+        if not isinstance(item, DataQueryBinding):
+            return item
+        elif item.kind == 'positional':
+            return self.bindings_positional[int(item.key)]
+        else:
+            return self.bindings_named[str(item.key)]
+    
+    def _resolve_token_test_batch_structural(self, ret: dict, idx: int) -> None:
+        # Bindings in attribute or test positions shape the plan itself, so they are bound at compile time
+        # and the resulting plan is not shared through the plan cache.
+        if idx < len(ret['args']) and isinstance(ret['args'][idx], DataQueryBinding):
+            ret['args'][idx] = self._resolve_token_binding(ret['args'][idx])
+            self.plan_volatile = True
+    
     def _resolve_token_test_batch(self) -> dict:
         ret = {
             'negate': False,
@@ -177,6 +194,7 @@ class DataQuery:
         if not self.is_mod_attr():
             ret['args'].insert(0, 'value')
         else:
+            self._resolve_token_test_batch_structural(ret, 0)
             ret['args'][0] = Convert_to_data_key('value', ret['args'][0])
         
         if self.is_mod_attr():
@@ -185,9 +203,11 @@ class DataQuery:
         if len(ret['args']) < 2:
             raise ValueError(f'Test not found in query syntax: {Convert_to_text(ret)}')
 
+        self._resolve_token_test_batch_structural(ret, 1)
         if ret['args'][1] == 'not':
             ret['negate'] = True
             ret['args'] = [arg_ for idx_, arg_ in enumerate(ret['args']) if idx_ != 1]
+            self._resolve_token_test_batch_structural(ret, 1)
         
         ret['args'][1] = self._resolve_token_test_fqn(ret['args'][1])
             
@@ -210,8 +230,23 @@ class DataQuery:
     def set_context(self, context: t.Optional[Context]) -> None:
         self.context = context
     
-    def set_data(self, data: t.Sequence[t.Any]) -> None:
+    def set_data(self, data: t.Iterable[t.Any]) -> None:
+        self.source = data
+        self.stream = None
+        
+        if isinstance(data, t.Iterator):
+            # Iterators (generators, file objects) are consumed lazily, the attribute mode is decided by the first item
+            self.data = []
+            first = next(data, _MISSING)
+            self.mod_attr = first is not _MISSING and Validate_is_mapping(first)
+            
+            if first is not _MISSING:
+                self.stream = itertools.chain([first], data)
+            
+            return
+        
         self.data = list(data)
+        self.mod_attr = Validate_is_enumeratable_of_mappings(self.data)
     
     def set_query(
         self, 
@@ -222,47 +257,53 @@ class DataQuery:
         operators_or: list[str] = []
     ) -> None:
         self.__set_operators(operators_and, operators_or)
-        query = query.strip()
-        
-        if query.count('(') != query.count(')'):
-            raise ValueError('Invalid query syntax: Number of parentheses not matching.')
+        self.bindings_positional = list(bindings_positional)
+        self.bindings_named = Data_combine(self.cfg.get('defaults.bindings.named', {}), bindings_named)
 
-        if not Validate_is_int_even(query.count('`')):
-            raise ValueError('Invalid query syntax: Number of backticks not even.')
+        plan_key = self.get_plan_cache_key(query)
+        plan = DataQueryPlanCache.get(plan_key) if self.is_plan_cacheable() else None
+        self.plan_cache_hit = plan is not None
         
-        pattern_operators = re.compile(rf'\\s+({'|'.join([re.escape(oper) for oper in self.operators_and + operators_or])})\\s+')
-        pattern_query_parenthese = re.compile(r'\\(\\s*([a-z][a-z0-9_.]*\\s+[a-z][a-z0-9_.]*(?:\\s+(?:\\?|\\:[a-z][a-z0-9_]*))?)\\s*\\)')
-        bindings_named = Data_combine(self.cfg.get('defaults.bindings.named', {}), bindings_named)
-
-        query = re.sub(r'\)', ') ', query)
-        query = re.sub(r'\(', '( ', query)
-        query = re.sub(r'\(([A-Za-z0-9])', '( \\1', query)
-        query = re.sub(r'([A-Za-z0-9?])\)', '\\1 )', query)
-        query = re.sub(r'\:+([A-Za-z0-9_]+?)', ':\\1', query)
-        query = re.sub(r'\`+', '`', query)
-        query = pattern_operators.sub(r' \1 ', query)
-        query = re.sub(r'\s+', r' ', query.strip())
+        if plan is None:
+            plan = self.compile_query(query)
+            
+            if self.is_plan_cacheable() and not plan['volatile']:
+                DataQueryPlanCache.set(plan_key, plan)
+        
+        self.query = plan['query']
+        self.plan_volatile = plan['volatile']
+        self.tokens = Fluent(self.bind_tokens(plan['tokens']))
+    
+    def compile_query(self, query: str) -> dict:
+        query = query.strip()
+        lexemes = DataQueryLexer(self.operators_and, self.operators_or).tokenize(query)
+        tree = DataQueryParser(query, lexemes, self.cfg.get('parser.depth')).parse()
         
-        while True:
-            new_query = pattern_query_parenthese.sub(r'\1', query)
-            if new_query == query:
-                break
-            query = new_query
+        self.query = query
+        self.plan_volatile = False
+        self.cfg.set('b_pos', 0)
+        self.resolve_tokens(tree)
         
-        query = '( ' + query + ' )'
-
-        if query.count('?') != len(bindings_positional):
+        if self.cfg.get('b_pos', 0) != len(self.bindings_positional):
             raise ValueError('Invalid number of positional bindings')
         
-        b_named = list(set(re.findall(r'[\(+|\s]?:+([A-Za-z0-9_]+)[\)+|\s]?', query)))
+        self.query = '( ' + ' '.join(lexeme.value for lexeme in lexemes) + ' )'
         
-        if not Validate_contains(bindings_named, *b_named, all = True):
-            raise ValueError('Missing named bindings')
+        return {
+            'query': self.query,
+            'tokens': self.get_plan_tokens(),
+            'volatile': self.plan_volatile,
+        }
+    
+    def bind_tokens(self, tokens: t.Any) -> t.Any:
+        if isinstance(tokens, DataQueryBinding):
+            return self._resolve_token_binding(tokens)
+        elif isinstance(tokens, dict):
+            return {key_: self.bind_tokens(val_) for key_, val_ in tokens.items()}
+        elif isinstance(tokens, list):
+            return [self.bind_tokens(item) for item in tokens]
         
-        self.query = query
-        self.bindings_positional = bindings_positional
-        self.bindings_named = bindings_named
-        self.resolve_tokens()
+        return tokens
     
     def __set_operators(self, operators_and: list[str] = [], operators_or: list[str] = []) -> None:
         opposites_ = {'and': 'or', 'or': 'and'}
@@ -279,16 +320,27 @@ class DataQuery:
             if Validate_filled(Data_difference(operators, current)):
                 setattr(self, f'operators_{type_}', operators)
     
-    def get_query_segments(self) -> list:
-        return self.query.split(' ')
-
     def get_tokens(self) -> dict:
-        ret = self.tokens.all()
-        
-        if '_meta' in ret:
-            del ret['_meta']
+        return dict(sorted([(key_, val_) for key_, val_ in dict(self.tokens.data).items() if key_ != '_meta']))
+    
+    def get_plan_tokens(self) -> dict:
+        ret = {key_: val_ for key_, val_ in dict(self.tokens.data).items() if key_ != '_meta'}
+        ret['_meta'] = {'data_keys': list(self.tokens.get('_meta.data_keys', []))}
         
-        return dict(sorted(ret.items()))
+        return ret
+    
+    def get_plan_cache_key(self, query: str) -> tuple:
+        return (
+            query.strip(),
+            tuple(self.operators_and),
+            tuple(self.operators_or),
+            len(self.bindings_positional),
+            tuple(sorted(self.bindings_named.keys())),
+            self.is_mod_attr(),
+        )
+    
+    def get_plan_cache_info(self) -> dict:
+        return dict(DataQueryPlanCache.info(), hit=self.plan_cache_hit)
     
     def get_token_masters(self, exclude_main: bool = False) -> list:
         return list(sorted([key_ for key_ in self.tokens.keys() if '_' not in str(key_) and (not exclude_main or str(key_) != '0')]))
@@ -304,6 +356,27 @@ class DataQuery:
         else:
             return []
     
+    def get_result_limit(self) -> t.Optional[int]:
+        limit = self.cfg.get('settings.limit')
+        
+        # Only false disables the limit, 0 compares equal to it but is rejected like any other value below 1
+        if Validate_filled(limit) and limit is not False:
+            limit = int(limit)
+            if limit < 1:
+                raise ValueError(f'Invalid result limit [{limit}]')
+            
+            return 1 if self.is_first_result() else limit
+        
+        return 1 if self.is_first_result() else None
+    
+    def get_parallel_workers(self) -> int:
+        workers = self.cfg.get('settings.workers', self.cfg.get('parallel.workers'))
+        
+        return max(1, int(workers if Validate_filled(workers) else (os.cpu_count() or 1)))
+    
+    def get_stream_chunk_size(self) -> int:
+        return max(1, int(self.cfg.get('settings.chunk', self.cfg.get('stream.chunk', 256))))
+    
     def get_tokens_master_condition(self) -> str:
         return self.tokens.get('0.cond')
     
@@ -313,8 +386,49 @@ class DataQuery:
     def is_mode_debug(self) -> bool:
         return self.cfg.get('settings.debug') == True
     
+    def is_mode_explain(self) -> bool:
+        return self.cfg.get('settings.explain') == True
+    
+    def is_mode_native(self) -> bool:
+        return self.cfg.get('settings.native', True) != False
+    
+    def is_mode_optimise(self) -> bool:
+        return self.cfg.get('settings.optimise', True) != False
+    
+    def is_mode_statistics(self) -> bool:
+        return self.cfg.get('settings.statistics') == True
+    
+    def is_mode_stream(self) -> bool:
+        if self.is_streamed():
+            return True
+        elif self.cfg.has('settings.stream'):
+            return self.cfg.get('settings.stream') == True
+        
+        return self.get_result_limit() is not None and not self.is_mode_index()
+    
+    def is_mode_parallel(self) -> bool:
+        enabled = self.cfg.get('settings.parallel', self.cfg.get('parallel.enabled', False))
+        if enabled == False or Validate_blank(enabled):
+            return False
+        elif self.is_mode_stream() or self.is_mode_index() or self.is_mode_explain() or self.get_parallel_workers() < 2:
+            return False
+        
+        return len(self.data) >= int(self.cfg.get('settings.parallel_threshold', self.cfg.get('parallel.threshold', 50000)))
+    
+    def is_mode_index(self) -> bool:
+        return Validate_filled(self.cfg.get('settings.index')) and self.cfg.get('settings.index') != False
+    
     def is_mod_attr(self) -> bool:
-        return Validate_is_enumeratable_of_mappings(self.data)
+        return self.mod_attr
+    
+    def is_streamed(self) -> bool:
+        return self.stream is not None
+    
+    def has_data(self) -> bool:
+        return self.is_streamed() or Validate_filled(self.data)
+    
+    def is_plan_cacheable(self) -> bool:
+        return self.cfg.get('settings.cache', True) != False
     
     def is_token_segment_operator_and(self, segment: str) -> bool:
         return segment in self.operators_and
@@ -325,15 +439,6 @@ class DataQuery:
     def is_token_segment_operator(self, segment: str) -> bool:
         return self.is_token_segment_operator_and(segment) or self.is_token_segment_operator_or(segment)
     
-    def has_token_batch_args(self) -> bool:
-        return self.tokens.filled('_meta.batch.args')
-    
-    def has_token_batch_kwargs(self) -> bool:
-        return self.tokens.filled('_meta.batch.kwargs')
-
-    def should_token_batch_finalise(self) -> bool:
-        return self.has_token_batch_args() or self.has_token_batch_kwargs()
-
     @staticmethod
     def is_token_segment_item_extra_args(item: t.Any) -> bool:
         return Validate_is_string(item) and Validate_str_wrapped(item, '`')
@@ -44,17 +44,37 @@ UniqueAlias = str
 ### END: Generic - Types
 
 ### BEGIN: Modules
+# Getters are cached, a missing optional module is only looked up once
+@functools.cache
 def cerberus():
     import cerberus
     return cerberus
 
+@functools.cache
 def pydantic():
     import pydantic
     return pydantic
 
+@functools.cache
 def pydash():
     import pydash
     return pydash
+
+@functools.cache
+def xxhash():
+    try:
+        import xxhash
+        return xxhash
+    except ImportError:
+        return None
+
+@functools.cache
+def orjson():
+    try:
+        import orjson
+        return orjson
+    except ImportError:
+        return None
 ### END: Modules
 
 ### BEGIN: Data Classes
@@ -448,6 +468,14 @@ CONF = tt.MappingProxyType(
             },
         },
         'data_query': {
+            'cache': {
+                'plans': {
+                    'size': 256,
+                },
+                'indexes': {
+                    'size': 32,
+                },
+            },
             'defaults': {
                 'bindings': {
                     'named': {
@@ -456,6 +484,17 @@ CONF = tt.MappingProxyType(
                     },
                 },
             },
+            'parser': {
+                'depth': 64,
+            },
+            'stream': {
+                'chunk': 256,
+            },
+            'parallel': {
+                'enabled': False,
+                'threshold': 50000,
+                'workers': None,
+            },
             'test': {
                 'prefixes': {
                     'a.b.': "ansible.builtin.",
@@ -466,6 +505,31 @@ CONF = tt.MappingProxyType(
                 },
             },
         },
+        'convert': {
+            'structural_hash': {
+                # None keeps exact structural keys, otherwise one of 'auto', 'xxhash' or 'blake2b'
+                'digest': None,
+                'cache': {
+                    'size': 1024,
+                },
+            },
+            'parse': {
+                'cache': {
+                    'size': 64,
+                },
+            },
+            # None leaves the budget unbounded, parse re-reads strings holding json or yaml documents
+            'safe_json': {
+                'parse': False,
+                'max_depth': None,
+                'max_items': None,
+            },
+            # 'auto' picks orjson / libyaml when importable, 'json' / 'python' pin the pure backends
+            'backends': {
+                'json': 'auto',
+                'yaml': 'auto',
+            },
+        },
         'jinja': {
             "prefixes": {
                 "a.b.": "ansible.builtin.",
@@ -5,10 +5,10 @@ from pathlib import Path as PathlibPath
 ### END: Imports
 ### BEGIN: ImportManager
 from ansible_collections.aybarsm.utils.plugins.module_utils.support.convert import (
-	Convert_as_non_native_types, Convert_from_json, Convert_from_lua,
-	Convert_from_toml, Convert_from_yaml, Convert_to_ip_address,
-	Convert_to_ip_network, Convert_to_iterable, Convert_to_json,
-	Convert_to_string, Convert_to_text,
+	Convert_as_non_native_types, Convert_as_parsed, Convert_from_lua,
+	Convert_from_toml, Convert_to_ip_address, Convert_to_ip_network,
+	Convert_to_iterable, Convert_to_json, Convert_to_string,
+	Convert_to_text,
 )
 from ansible_collections.aybarsm.utils.plugins.module_utils.support.data import (
 	Data_get, Data_has,
@@ -19,7 +19,67 @@ from ansible_collections.aybarsm.utils.plugins.module_utils.support.str import (
 ### END: ImportManager
 
 ### BEGIN: Data
+def _blank_str(data: str) -> bool:
+    return data.strip() == '' or data.startswith('__omit_place_holder__')
+
+def _blank_sized(data: t.Any) -> bool:
+    return len(data) == 0
+
+def _blank_mapping(data: t.Any) -> bool:
+    return len(data.keys()) == 0
+
+def _blank_never(data: t.Any) -> bool:
+    return False
+
+def _blank_always(data: t.Any) -> bool:
+    return True
+
+_BLANK_DISPATCH: dict[type, t.Callable[[t.Any], bool]] = {
+    type(None): _blank_always,
+    str: _blank_str,
+    list: _blank_sized,
+    tuple: _blank_sized,
+    dict: _blank_mapping,
+    bool: _blank_never,
+    int: _blank_never,
+    float: _blank_never,
+    complex: _blank_never,
+    bytes: _blank_never,
+    bytearray: _blank_sized,
+    set: _blank_never,
+    frozenset: _blank_never,
+}
+
+def _blank_resolve(cls: type) -> t.Callable[[t.Any], bool]:
+    # Mirrors the order of the checks in _blank_uncached, Ansible type names only matter for
+    # the types carrying them
+    if cls.__name__.startswith('AnsibleUndefined'):
+        return _blank_always
+    elif issubclass(cls, str):
+        return _blank_str
+    elif issubclass(cls, bytes):
+        return _blank_never
+    elif issubclass(cls, t.Sequence):
+        return _blank_sized
+    elif issubclass(cls, t.Mapping):
+        return _blank_mapping
+    
+    return _blank_never
+
 def Validate_is_blank(data: t.Any)-> bool:
+    cls = type(data)
+    handler = _BLANK_DISPATCH.get(cls)
+    
+    if handler is None:
+        # Proxies reporting another __class__ pass isinstance checks their type would fail, so they are never cached
+        if data.__class__ is not cls:
+            return _blank_uncached(data)
+        
+        handler = _BLANK_DISPATCH[cls] = _blank_resolve(cls)
+    
+    return handler(data)
+
+def _blank_uncached(data: t.Any)-> bool:
     if Validate_is_none(data):
         return True
     elif Validate_is_string(data) and data.strip() == '':
@@ -39,10 +99,16 @@ def Validate_is_filled(data: t.Any)-> bool:
     return not Validate_is_blank(data)
 
 def Validate_blank(data: t.Any, **kwargs)-> bool:
+    if not kwargs:
+        return Validate_is_blank(data)
+    
     type_ = str(kwargs.get('type', ''))
     return Validate_is_blank(data) and (not Validate_is_filled(type_) or Validate_is_type_name(data, type_))
 
 def Validate_filled(data: t.Any, **kwargs)-> bool:
+    if not kwargs:
+        return not Validate_is_blank(data)
+    
     type_ = str(kwargs.get('type', ''))
     return Validate_is_filled(data) and (not Validate_is_filled(type_) or Validate_is_type_name(data, type_))
 
@@ -356,8 +422,8 @@ def Validate_str_is_json(
     type_: t.Literal['any', 'mapping', 'sequence'] = 'any'
 )-> bool:
     try:
-        parsed = Convert_from_json(data)
-        ret = Validate_is_type(parsed, type_)
+        ok, parsed = Convert_as_parsed(data, 'json')
+        ret = ok and Validate_is_type(parsed, type_)
     except (Exception):
         ret = False
     
@@ -368,8 +434,8 @@ def Validate_str_is_yaml(
     type_: t.Literal['any', 'mapping', 'sequence'] = 'any'
 )-> bool:
     try:
-        parsed = Convert_from_yaml(data)
-        ret = Validate_is_type(parsed, type_)
+        ok, parsed = Convert_as_parsed(data, 'yaml')
+        ret = ok and Validate_is_type(parsed, type_)
     except (Exception):
         ret = False
     
@@ -5,7 +5,7 @@ import json, yaml, re, requests
 ### BEGIN: ImportManager
 from ansible_collections.aybarsm.utils.plugins.module_utils.support.data import (
 	Data_all_except, Data_append, Data_combine,
-	Data_dot, Data_dot_sort_keys, Data_get,
+	Data_dot_iter, Data_dot_sort_keys, Data_get,
 	Data_has, Data_only_with,
 )
 from ansible_collections.aybarsm.utils.plugins.module_utils.support.str import (
@@ -368,7 +368,9 @@ class Swagger:
         return ret
     
     def _resolve_validation_schema_real_key_paths(self, ret: dict) -> dict:
-        ret_dot = dict(Data_dot_sort_keys(Data_dot(ret)))
+        ret_dot = dict(Data_dot_sort_keys({
+            key: value for key, value in Data_dot_iter(ret) if str(key).endswith('.type') and not str(key).startswith('_')
+        }))
 
         Data_set(ret, '_.key_map', {})
         
@@ -445,7 +447,8 @@ class Swagger:
     def _cleanup_validation_schema(self, ret: dict) -> dict:
         nest_key = self.get_validation_nest_key()
         
-        for key, value in (dict(Data_dot_sort_keys(Data_dot(ret), asc=False))).items():
+        types = {key: value for key, value in Data_dot_iter(ret) if str(key).endswith('.type') and value == 'dict'}
+        for key, value in (dict(Data_dot_sort_keys(types, asc=False))).items():
             if str(key).startswith('_') or not str(key).endswith('.type') or value != 'dict':
                 continue
             
@@ -724,13 +727,10 @@ class Swagger:
         pattern_ = Data_get(cfg, 'ref_pattern', '.*\\.\\$ref.*$')
         pattern = re.compile(pattern_)
         ret = swagger.copy()
-        dotted = Data_dot(swagger)
-        dotted_keys = [item for item in dotted.keys() if pattern.match(item)]
-        ref_keys = Data_dot_sort_keys(dotted_keys, asc = False)
-        ref_map = Data_dot_sort_keys(Data_only_with(dotted, *ref_keys, no_dot = True), asc = False) #type: ignore
+        ref_map = {key: value for key, value in Data_dot_iter(swagger) if pattern.match(key)}
+        ref_keys = Data_dot_sort_keys(list(ref_map.keys()), asc = False)
         ref_sources_keys = [Swagger.resolve_ref_key(ref_source_key) for ref_source_key in set(ref_map.values())] #type: ignore
-        ref_sources_dotted = Data_dot(Data_only_with(swagger, *ref_sources_keys))
-        ref_sources_dotted_keys = [item for item in ref_sources_dotted.keys() if pattern.match(item)]
+        ref_sources_dotted_keys = [key for key, _ in Data_dot_iter(Data_only_with(swagger, *ref_sources_keys)) if pattern.match(key)]
         ref_sources_ref_keys_primary = Data_dot_sort_keys(ref_sources_dotted_keys, asc = False)
         ref_sources_ref_keys_secondary = [item for item in ref_keys if item not in ref_sources_ref_keys_primary]
         iterate_ref_keys = ref_sources_ref_keys_primary + ref_sources_ref_keys_secondary #type: ignore
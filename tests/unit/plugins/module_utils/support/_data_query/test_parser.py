@@ -0,0 +1,25 @@
+import pytest
+from ansible_collections.aybarsm.utils.plugins.module_utils.support._data_query.parser import (
+    DataQueryLexer, DataQueryParser, DataQuerySyntaxError,
+)
+
+def parse(query: str, depth: int = 64) -> dict:
+    return DataQueryParser(query, DataQueryLexer(['and', '&&'], ['or', '||']).tokenize(query), depth).parse()
+
+def nested(levels: int) -> str:
+    query = 'a eq 1'
+    for idx in range(levels):
+        query = f'b{idx} eq {idx} {'and' if idx % 2 else 'or'} ({query})'
+    
+    return query
+
+def test_parser_accepts_groups_up_to_the_depth_limit():
+    assert parse(nested(64))['depth'] == 64
+
+@pytest.mark.parametrize('levels', [65, 300])
+def test_parser_rejects_groups_beyond_the_depth_limit(levels):
+    with pytest.raises(DataQuerySyntaxError, match='deeper than 64 levels'):
+        parse(nested(levels))
+
+def test_parser_collapses_redundant_parentheses_without_depth():
+    assert parse('(' * 300 + 'a eq 1' + ')' * 300)['operands'][0]['terms'] == ['a', 'eq', '1']
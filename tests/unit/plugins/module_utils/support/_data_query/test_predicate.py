@@ -0,0 +1,23 @@
+import pytest
+from ansible.plugins.test import core as ansible_tests
+from ansible_collections.aybarsm.utils.plugins.module_utils.support._data_query.predicate import (
+    DataQueryPredicate_resolve, DataQueryPredicate_regex,
+)
+
+VALUES = ['web01', 'WEB01', '', 1, 10, 2.5, True, False, None, b'web01']
+
+@pytest.mark.parametrize('test_name', ['match', 'search', 'regex'])
+@pytest.mark.parametrize('pattern', ['^1', 'web', '(?i)web', 'None', 'True', '\\.5$'])
+@pytest.mark.parametrize('value', VALUES)
+def test_regex_tests_match_the_ansible_tests(test_name, pattern, value):
+    native = DataQueryPredicate_resolve(f'ansible.builtin.{test_name}')
+    
+    assert native(value, pattern) == getattr(ansible_tests, test_name)(value, pattern)
+
+def test_regex_rejects_unknown_match_type():
+    with pytest.raises(ValueError, match='match_type'):
+        DataQueryPredicate_regex('web01', 'web', match_type='find')
+
+def test_regex_supports_fullmatch():
+    assert DataQueryPredicate_regex('web01', 'web\\d+', match_type='fullmatch')
+    assert not DataQueryPredicate_regex('web01x', 'web\\d+', match_type='fullmatch')
@@ -0,0 +1,24 @@
+from ansible_collections.aybarsm.utils.plugins.module_utils.support.convert import (
+    Convert_as_parsed, Convert_from_json, Convert_from_yaml, Convert_to_safe_json,
+)
+
+DOCUMENT = '{"a": [1, 2], "b": {"c": "x"}}'
+
+def test_probe_does_not_see_mutation_after_parse():
+    ok, probed = Convert_as_parsed(DOCUMENT, 'json')
+    assert ok
+    
+    parsed = Convert_from_json(DOCUMENT)
+    parsed['a'].append(99)
+    parsed['b']['c'] = 'MUTATED'
+    
+    assert Convert_as_parsed(DOCUMENT, 'json') == (True, {'a': [1, 2], 'b': {'c': 'x'}})
+    assert Convert_to_safe_json({'doc': DOCUMENT}, parse=True) == {'doc': {'a': [1, 2], 'b': {'c': 'x'}}}
+
+def test_converters_return_independent_values():
+    first = Convert_from_yaml(DOCUMENT)
+    second = Convert_from_yaml(DOCUMENT)
+    
+    assert first == second
+    assert first is not second
+    assert first['a'] is not second['a']